@@ -7,6 +7,7 @@ import sys
 import json
 import shutil
 import logging
+import threading
 import winreg
 from typing import Optional, Dict, Any, List
 
@@ -66,6 +67,8 @@ class Config:
 
     def __init__(self):
         self._config: Dict[str, Any] = {}
+        # Guards _config and file writes: history is saved from a background thread
+        self._save_lock = threading.RLock()
         self.api_status_cache: Dict[str, bool] = {}
         self.runtime_capabilities: Dict[str, bool] = {'vision': False, 'file': False}
         self._ensure_config_dir()
@@ -132,6 +135,11 @@ class Config:
 
     def save(self, secure: bool = False):
         """Save configuration to file."""
+        with self._save_lock:
+            self._save(secure)
+
+    def _save(self, secure: bool):
+        """Write configuration to file (caller holds _save_lock)."""
         self._ensure_config_dir()
         
         # Secure overwrite: write zeros to the file before truncating if secure delete is requested
@@ -145,8 +153,10 @@ class Config:
             except Exception:
                 pass
 
+        # Serialize first so a failed dump can't leave a truncated file
+        data = json.dumps(self._config, indent=2, ensure_ascii=False)
         with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self._config, f, indent=2, ensure_ascii=False)
+            f.write(data)
             f.flush()
             os.fsync(f.fileno()) # Force write to disk immediately
 
@@ -205,9 +215,10 @@ class Config:
 
             encrypted_keys.append(encrypted_config)
 
-        self._config['api_keys'] = encrypted_keys
-        self._config['encryption_version'] = 1  # Track encryption format
-        self.save(secure=secure)
+        with self._save_lock:
+            self._config['api_keys'] = encrypted_keys
+            self._config['encryption_version'] = 1  # Track encryption format
+            self.save(secure=secure)
 
     def get_api_key(self) -> str:
         """Get first API key (for backward compatibility)."""
@@ -243,21 +254,24 @@ class Config:
 
     def set_hotkeys(self, hotkeys: Dict[str, str]):
         """Set hotkey configuration."""
-        self._config['hotkeys'] = hotkeys
-        self.save()
+        with self._save_lock:
+            self._config['hotkeys'] = hotkeys
+            self.save()
 
     def set_hotkey(self, language: str, hotkey: str):
         """Set hotkey for a specific language."""
-        if 'hotkeys' not in self._config:
-            self._config['hotkeys'] = self.DEFAULT_HOTKEYS.copy()
-        self._config['hotkeys'][language] = hotkey
-        self.save()
+        with self._save_lock:
+            if 'hotkeys' not in self._config:
+                self._config['hotkeys'] = self.DEFAULT_HOTKEYS.copy()
+            self._config['hotkeys'][language] = hotkey
+            self.save()
 
     def remove_hotkey(self, language: str):
         """Remove hotkey for a specific language."""
-        if 'hotkeys' in self._config and language in self._config['hotkeys']:
-            del self._config['hotkeys'][language]
-            self.save()
+        with self._save_lock:
+            if 'hotkeys' in self._config and language in self._config['hotkeys']:
+                del self._config['hotkeys'][language]
+                self.save()
 
     # Custom hotkeys management
     def get_custom_hotkeys(self) -> Dict[str, str]:
@@ -266,17 +280,19 @@ class Config:
 
     def set_custom_hotkey(self, language: str, hotkey: str):
         """Set a custom hotkey for a language."""
-        if 'custom_hotkeys' not in self._config:
-            self._config['custom_hotkeys'] = {}
-        if len(self._config['custom_hotkeys']) < self.MAX_CUSTOM_HOTKEYS or language in self._config['custom_hotkeys']:
-            self._config['custom_hotkeys'][language] = hotkey
-            self.save()
+        with self._save_lock:
+            if 'custom_hotkeys' not in self._config:
+                self._config['custom_hotkeys'] = {}
+            if len(self._config['custom_hotkeys']) < self.MAX_CUSTOM_HOTKEYS or language in self._config['custom_hotkeys']:
+                self._config['custom_hotkeys'][language] = hotkey
+                self.save()
 
     def remove_custom_hotkey(self, language: str):
         """Remove a custom hotkey."""
-        if 'custom_hotkeys' in self._config and language in self._config['custom_hotkeys']:
-            del self._config['custom_hotkeys'][language]
-            self.save()
+        with self._save_lock:
+            if 'custom_hotkeys' in self._config and language in self._config['custom_hotkeys']:
+                del self._config['custom_hotkeys'][language]
+                self.save()
 
     def get_all_hotkeys(self) -> Dict[str, str]:
         """Get all hotkeys (default + custom)."""
@@ -291,8 +307,9 @@ class Config:
 
     def set_screenshot_hotkey(self, hotkey: str):
         """Set screenshot hotkey combination."""
-        self._config['screenshot_hotkey'] = hotkey
-        self.save()
+        with self._save_lock:
+            self._config['screenshot_hotkey'] = hotkey
+            self.save()
 
     def get_screenshot_target_language(self) -> str:
         """Get target language for screenshot translation.
@@ -304,21 +321,23 @@ class Config:
 
     def set_screenshot_target_language(self, language: str):
         """Set target language for screenshot translation."""
-        self._config['screenshot_target_language'] = language
-        self.save()
+        with self._save_lock:
+            self._config['screenshot_target_language'] = language
+            self.save()
 
     def restore_defaults(self):
         """Restore all settings to defaults except API keys."""
-        api_keys = self._config.get('api_keys', [])
-        self._config = self.DEFAULT_CONFIG.copy()
-        self._config['hotkeys'] = self.DEFAULT_HOTKEYS.copy()
-        self._config['custom_hotkeys'] = {}
-        self._config['api_keys'] = api_keys  # Preserve API keys with models
+        with self._save_lock:
+            api_keys = self._config.get('api_keys', [])
+            self._config = self.DEFAULT_CONFIG.copy()
+            self._config['hotkeys'] = self.DEFAULT_HOTKEYS.copy()
+            self._config['custom_hotkeys'] = {}
+            self._config['api_keys'] = api_keys  # Preserve API keys with models
         
-        # Preserve history
-        history = self._config.get('history', [])
-        self._config['history'] = history
-        self.save()
+            # Preserve history
+            history = self._config.get('history', [])
+            self._config['history'] = history
+            self.save()
 
     # Auto-start management
     def get_autostart(self) -> bool:
@@ -327,9 +346,10 @@ class Config:
 
     def set_autostart(self, enable: bool):
         """Set auto-start with Windows."""
-        self._config['autostart'] = enable
+        with self._save_lock:
+            self._config['autostart'] = enable
+            self.save()
         self._update_registry_autostart(enable)
-        self.save()
 
     def _update_registry_autostart(self, enable: bool):
         """Update Windows registry for auto-start."""
@@ -380,8 +400,9 @@ class Config:
 
     def set_check_updates(self, enable: bool):
         """Set check for updates setting."""
-        self._config['check_updates'] = enable
-        self.save()
+        with self._save_lock:
+            self._config['check_updates'] = enable
+            self.save()
 
     def get_auto_check_updates(self) -> bool:
         """Get whether to auto-check updates on startup."""
@@ -389,8 +410,9 @@ class Config:
 
     def set_auto_check_updates(self, enabled: bool):
         """Set auto-check updates on startup."""
-        self._config['auto_check_updates'] = enabled
-        self.save()
+        with self._save_lock:
+            self._config['auto_check_updates'] = enabled
+            self.save()
 
     # Trial mode settings
     def get_trial_mode_forced(self) -> bool:
@@ -399,8 +421,9 @@ class Config:
 
     def set_trial_mode_forced(self, enabled: bool):
         """Set trial mode forced flag."""
-        self._config['trial_mode_forced'] = enabled
-        self.save()
+        with self._save_lock:
+            self._config['trial_mode_forced'] = enabled
+            self.save()
 
     def get_trial_last_api_check(self) -> str:
         """Get ISO datetime of last API check for trial mode."""
@@ -408,8 +431,9 @@ class Config:
 
     def set_trial_last_api_check(self, dt_str: str):
         """Set last API check datetime for trial mode."""
-        self._config['trial_last_api_check'] = dt_str
-        self.save()
+        with self._save_lock:
+            self._config['trial_last_api_check'] = dt_str
+            self.save()
 
     # Theme settings
     def get_theme(self) -> str:
@@ -418,8 +442,9 @@ class Config:
 
     def set_theme(self, theme: str):
         """Set UI theme."""
-        self._config['theme'] = theme
-        self.save()
+        with self._save_lock:
+            self._config['theme'] = theme
+            self.save()
 
     # API Capability Management
     def update_api_capabilities(self, api_key: str, model_name: str, vision_capable: bool, file_capable: bool):
@@ -428,20 +453,21 @@ class Config:
         This is called when an API is tested successfully.
         The flags persist until the API is re-tested and fails, or deleted.
         """
-        api_keys = self.get_api_keys()
-        updated = False
-        for api_config in api_keys:
-            if api_config.get('api_key') == api_key and api_config.get('model_name') == model_name:
-                api_config['vision_capable'] = vision_capable
-                api_config['file_capable'] = file_capable
-                updated = True
-                break
-
-        if updated:
-            # Use set_api_keys to properly encrypt and save
-            self.set_api_keys(api_keys)
-            self._auto_update_toggles()
-            self.save()
+        with self._save_lock:
+            api_keys = self.get_api_keys()
+            updated = False
+            for api_config in api_keys:
+                if api_config.get('api_key') == api_key and api_config.get('model_name') == model_name:
+                    api_config['vision_capable'] = vision_capable
+                    api_config['file_capable'] = file_capable
+                    updated = True
+                    break
+
+            if updated:
+                # Use set_api_keys to properly encrypt and save
+                self.set_api_keys(api_keys)
+                self._auto_update_toggles()
+                self.save()
 
     def _auto_update_toggles(self):
         """Auto-enable toggles based on API capabilities."""
@@ -475,22 +501,25 @@ class Config:
 
     def set_nlp_installed(self, languages: List[str]):
         """Set list of installed NLP language packs."""
-        self._config['nlp_installed'] = languages
-        self.save()
+        with self._save_lock:
+            self._config['nlp_installed'] = languages
+            self.save()
 
     def add_nlp_installed(self, language: str):
         """Add a language to installed NLP packs."""
-        installed = self.get_nlp_installed()
-        if language not in installed:
-            installed.append(language)
-            self.set_nlp_installed(installed)
+        with self._save_lock:
+            installed = self.get_nlp_installed()
+            if language not in installed:
+                installed.append(language)
+                self.set_nlp_installed(installed)
 
     def remove_nlp_installed(self, language: str):
         """Remove a language from installed NLP packs."""
-        installed = self.get_nlp_installed()
-        if language in installed:
-            installed.remove(language)
-            self.set_nlp_installed(installed)
+        with self._save_lock:
+            installed = self.get_nlp_installed()
+            if language in installed:
+                installed.remove(language)
+                self.set_nlp_installed(installed)
 
     def is_nlp_installed(self, language: str) -> bool:
         """Check if a language NLP pack is installed."""
@@ -527,30 +556,31 @@ class Config:
                     )
                     error_type = 'other'
 
-            if 'update_stats' not in self._config:
-                self._config['update_stats'] = {
-                    'total': 0,
-                    'success': 0,
-                    'failed': 0,
-                    'last_check': None,
-                    'last_success': None
-                }
-
-            stats = self._config['update_stats']
-            stats['total'] += 1
-            stats['last_check'] = datetime.now().isoformat()
-
-            if success:
-                stats['success'] += 1
-                stats['last_success'] = datetime.now().isoformat()
-            else:
-                stats['failed'] += 1
-                if error_type:
-                    if 'error_types' not in stats:
-                        stats['error_types'] = {}
-                    stats['error_types'][error_type] = stats['error_types'].get(error_type, 0) + 1
+            with self._save_lock:
+                if 'update_stats' not in self._config:
+                    self._config['update_stats'] = {
+                        'total': 0,
+                        'success': 0,
+                        'failed': 0,
+                        'last_check': None,
+                        'last_success': None
+                    }
+
+                stats = self._config['update_stats']
+                stats['total'] += 1
+                stats['last_check'] = datetime.now().isoformat()
+
+                if success:
+                    stats['success'] += 1
+                    stats['last_success'] = datetime.now().isoformat()
+                else:
+                    stats['failed'] += 1
+                    if error_type:
+                        if 'error_types' not in stats:
+                            stats['error_types'] = {}
+                        stats['error_types'][error_type] = stats['error_types'].get(error_type, 0) + 1
 
-            self.save()
+                self.save()
             logging.debug(f"Update check recorded: success={success}, total={stats['total']}")
 
         except Exception as e:
@@ -564,8 +594,9 @@ class Config:
 
     def set_last_run_version(self, version: str):
         """Set the last run version."""
-        self._config['last_run_version'] = version
-        self.save()
+        with self._save_lock:
+            self._config['last_run_version'] = version
+            self.save()
 
     # Generic getter/setter
     def get(self, key: str, default: Any = None) -> Any:
@@ -574,5 +605,6 @@ class Config:
 
     def set(self, key: str, value: Any):
         """Set a config value."""
-        self._config[key] = value
-        self.save()
+        with self._save_lock:
+            self._config[key] = value
+            self.save()
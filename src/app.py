@@ -1329,6 +1329,12 @@ IMPORTANT: Translate ALL text to {self.selected_language}. Process ALL files. Ex
         except Exception as e:
             logging.warning(f"Error stopping drop handler: {e}")
 
+        # Write pending history changes
+        try:
+            self.translation_service.history_manager.close()
+        except Exception as e:
+            logging.warning(f"Error saving history: {e}")
+
         # Close tooltip
         self.close_tooltip()
 
@@ -1,6 +1,14 @@
 """Generate icon images for UI elements."""
+import functools
+import hashlib
+import io
+import os
+
 from PIL import Image, ImageDraw
 
+# Part of the .sha stamp: bump when the drawing code changes so icons are regenerated
+ICON_RENDER_VERSION = 1
+
 
 def create_add_button_icon(size=56, color='#888888', bg_color=None):
     """Create a dashed circle with plus sign icon.
@@ -13,17 +21,25 @@ def create_add_button_icon(size=56, color='#888888', bg_color=None):
     Returns:
         PIL Image object
     """
+    # Rendering is deterministic, so hand out copies of the cached image
+    return _render_add_button_icon(size, color, bg_color).copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _render_add_button_icon(size, color, bg_color):
+    """Draw the add button icon (cached, callers must not mutate the result)."""
     # Create image with transparency
     if bg_color:
         img = Image.new('RGBA', (size, size), bg_color)
     else:
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
 
-    draw = ImageDraw.Draw(img)
+    _draw_add_button(img, size, color)
+    return img
 
-    center = size // 2
-    radius = (size // 2) - 4  # Leave some margin
 
+def _draw_add_button(img, size, color):
+    """Draw the dashed circle and plus sign onto an existing RGBA image."""
     # Convert hex color to RGB
     if color.startswith('#'):
         r = int(color[1:3], 16)
@@ -33,44 +49,62 @@ def create_add_button_icon(size=56, color='#888888', bg_color=None):
     else:
         rgb_color = (136, 136, 136, 255)  # Default gray
 
-    # Draw dashed circle using small arcs
-    num_dashes = 24
-    dash_angle = 360 / num_dashes
-    gap_ratio = 0.4  # Gap takes 40% of each segment
+    # Stamp the pre-rendered dashed circle and plus sign
+    img.paste(rgb_color, (0, 0), _dashed_circle_mask(size))
+    img.paste(rgb_color, (0, 0), _plus_mask(size, 2))
 
-    for i in range(num_dashes):
-        start_angle = i * dash_angle
-        end_angle = start_angle + dash_angle * (1 - gap_ratio)
 
-        # Draw arc segment
-        bbox = [center - radius, center - radius, center + radius, center + radius]
-        draw.arc(bbox, start=start_angle, end=end_angle, fill=rgb_color, width=2)
+@functools.lru_cache(maxsize=8)
+def _plus_mask(size, line_width):
+    """Render the plus sign once per size as a grayscale mask."""
+    mask = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(mask)
 
-    # Draw plus sign
+    center = size // 2
     plus_len = size // 5
-    line_width = 2
 
     # Horizontal line
     draw.line(
         [(center - plus_len, center), (center + plus_len, center)],
-        fill=rgb_color,
+        fill=255,
         width=line_width
     )
 
     # Vertical line
     draw.line(
         [(center, center - plus_len), (center, center + plus_len)],
-        fill=rgb_color,
+        fill=255,
         width=line_width
     )
 
-    return img
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _dashed_circle_mask(size):
+    """Render the dashed circle once per size as a grayscale mask."""
+    mask = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+
+    center = size // 2
+    radius = (size // 2) - 4  # Leave some margin
+    bbox = [center - radius, center - radius, center + radius, center + radius]
+
+    # Draw dashed circle using small arcs
+    num_dashes = 24
+    dash_angle = 360 / num_dashes
+    gap_ratio = 0.4  # Gap takes 40% of each segment
+
+    for i in range(num_dashes):
+        start_angle = i * dash_angle
+        end_angle = start_angle + dash_angle * (1 - gap_ratio)
+        draw.arc(bbox, start=start_angle, end=end_angle, fill=255, width=2)
+
+    return mask
 
 
 def generate_all_icons():
     """Generate all icon variations."""
-    import os
-
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -82,11 +116,60 @@ def generate_all_icons():
         (56, 'add_btn_light_blue.png', '#5a9fd4'), # Drag-drop hover
     ]
 
+    # One scratch canvas per size, cleared and redrawn for each icon
+    canvases = {}
+
     for size, name, color in sizes_and_names:
-        img = create_add_button_icon(size=size, color=color)
         path = os.path.join(script_dir, name)
-        img.save(path, 'PNG')
-        print(f"Created: {path}")
+        sha_path = os.path.splitext(path)[0] + '.sha'
+        digest = hashlib.sha1(f"{ICON_RENDER_VERSION}:{size}:{color}".encode()).hexdigest()[:8]
+
+        # Skip icons that are already up to date on disk
+        if os.path.exists(path) and _read_sidecar(sha_path) == digest:
+            print(f"Up to date: {path}")
+            continue
+
+        img = canvases.get(size)
+        if img is None:
+            img = canvases[size] = Image.new('RGBA', (size, size))
+        else:
+            img.paste((0, 0, 0, 0), (0, 0, size, size))
+        _draw_add_button(img, size, color)
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG')
+        written = _write_if_changed(path, buffer.getvalue())
+        with open(sha_path, 'w', encoding='utf-8') as f:
+            f.write(digest)
+        print(f"{'Created' if written else 'Unchanged'}: {path}")
+
+
+def _write_if_changed(path, data):
+    """Atomically write data to path unless the file already has that content.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _read_sidecar(sha_path):
+    """Read the hash stored next to a generated icon, or None if missing."""
+    try:
+        with open(sha_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
 
 if __name__ == '__main__':
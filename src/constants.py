@@ -13,7 +13,7 @@ LOCK_PORT = 47823  # Port for single instance lock
 
 # ============== REMOTE CONFIG ==============
 REMOTE_CONFIG_URL = "https://crossname.trial-api.workers.dev/v1/config"
-REMOTE_CONFIG_CACHE_TTL = 86400  # 24 hours in seconds
+REMOTE_CONFIG_CACHE_TTL = 3600  # Refresh in background after 1 hour (stale config is still served)
 
 # ============== TIMING ==============
 COOLDOWN = 2.0  # Translation cooldown in seconds
@@ -350,6 +350,27 @@ VISION_MODELS = {
     'openrouter': ['*'],  # OpenRouter aggregates models - rely on naming heuristics
 }
 
+# ============== DEFAULT MODELS ==============
+# Default models to try for each provider when model is "Auto"
+# Ordered by preference (best models first)
+# Keys match PROVIDERS_LIST exactly (Title Case)
+# NOTE: These are hardcoded fallbacks. The active list comes from get_config().
+DEFAULT_MODELS_BY_PROVIDER = {
+    'Google': ['gemini-2.0-flash', 'gemini-1.5-flash', 'gemini-1.5-pro'],
+    'OpenAI': ['gpt-4o-mini', 'gpt-4o', 'gpt-3.5-turbo'],
+    'Anthropic': ['claude-3-5-sonnet-20241022', 'claude-3-5-haiku-20241022', 'claude-3-haiku-20240307'],
+    'DeepSeek': ['deepseek-chat', 'deepseek-coder'],
+    'Groq': ['llama-3.3-70b-versatile', 'llama-3.1-70b-versatile', 'mixtral-8x7b-32768'],
+    'xAI': ['grok-2', 'grok-beta'],
+    'Mistral': ['mistral-large-latest', 'mistral-small-latest'],
+    'Perplexity': ['sonar', 'sonar-pro'],
+    'Cerebras': ['llama-3.3-70b', 'llama3.1-70b'],
+    'SambaNova': ['Meta-Llama-3.3-70B-Instruct', 'Meta-Llama-3.1-70B-Instruct'],
+    'Together': ['meta-llama/Llama-3.3-70B-Instruct-Turbo', 'meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo'],
+    'SiliconFlow': ['deepseek-ai/DeepSeek-V3', 'Qwen/Qwen2.5-72B-Instruct'],
+    'OpenRouter': ['google/gemini-2.0-flash-exp:free', 'meta-llama/llama-3.3-70b-instruct:free'],
+}
+
 # ============== TRIAL MODE ==============
 # Configuration for trial mode (users without API keys)
 TRIAL_MODE_ENABLED = True  # Set to False to disable trial mode completely
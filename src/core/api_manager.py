@@ -15,26 +15,6 @@ from src.core.remote_config import get_config
 from src.core.multimodal import MultimodalProcessor
 from src.core.ssl_pinning import get_ssl_context_for_url
 
-# Default models to try for each provider when model is "Auto"
-# Ordered by preference (best models first)
-# Keys match PROVIDERS_LIST exactly (Title Case)
-# NOTE: These are hardcoded fallbacks. The active list comes from get_config().
-DEFAULT_MODELS_BY_PROVIDER = {
-    'Google': ['gemini-2.0-flash', 'gemini-1.5-flash', 'gemini-1.5-pro'],
-    'OpenAI': ['gpt-4o-mini', 'gpt-4o', 'gpt-3.5-turbo'],
-    'Anthropic': ['claude-3-5-sonnet-20241022', 'claude-3-5-haiku-20241022', 'claude-3-haiku-20240307'],
-    'DeepSeek': ['deepseek-chat', 'deepseek-coder'],
-    'Groq': ['llama-3.3-70b-versatile', 'llama-3.1-70b-versatile', 'mixtral-8x7b-32768'],
-    'xAI': ['grok-2', 'grok-beta'],
-    'Mistral': ['mistral-large-latest', 'mistral-small-latest'],
-    'Perplexity': ['sonar', 'sonar-pro'],
-    'Cerebras': ['llama-3.3-70b', 'llama3.1-70b'],
-    'SambaNova': ['Meta-Llama-3.3-70B-Instruct', 'Meta-Llama-3.1-70B-Instruct'],
-    'Together': ['meta-llama/Llama-3.3-70B-Instruct-Turbo', 'meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo'],
-    'SiliconFlow': ['deepseek-ai/DeepSeek-V3', 'Qwen/Qwen2.5-72B-Instruct'],
-    'OpenRouter': ['google/gemini-2.0-flash-exp:free', 'meta-llama/llama-3.3-70b-instruct:free'],
-}
-
 if TYPE_CHECKING:
     from src.core.provider_health import ProviderHealthManager
 
@@ -501,7 +481,7 @@ class AIAPIManager:
     def _try_auto_detect_model(self, api_key: str, provider: str, prompt: str) -> Optional[str]:
         """Try to auto-detect a working model for the given provider.
 
-        Tries models from DEFAULT_MODELS_BY_PROVIDER until one works.
+        Tries the default models for the provider (remote config) until one works.
         Caches the working model for future use.
 
         Returns:
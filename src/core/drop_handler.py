@@ -2,6 +2,7 @@
 Drag and Drop Handler for CrossTrans.
 Handles file drag-and-drop operations using various methods (tkinterdnd2, windnd, WM_DROPFILES).
 """
+import re
 import sys
 import queue
 import logging
@@ -28,10 +29,24 @@ try:
 except ImportError:
     HAS_WINDND = False
 
+# tkinterdnd2 file list: paths with spaces are wrapped in braces
+_TKDND_TOKEN_RE = re.compile(r'\{([^}]*)\}|(\S+)')
+
+
+def parse_tkdnd_paths(data: str) -> List[str]:
+    """Split a tkinterdnd2 drop string into file paths."""
+    paths = [m.group(1) or m.group(2) for m in _TKDND_TOKEN_RE.finditer(data)]
+    return [p for p in paths if p]
+
 
 class DropHandler:
     """Manages drag-and-drop file operations."""
 
+    # Drop queue polling: fast right after activity, slower while idle
+    QUEUE_POLL_ACTIVE_MS = 50
+    QUEUE_POLL_IDLE_MS = 250
+    QUEUE_IDLE_AFTER_POLLS = 20  # Empty fast polls (~1 s) before slowing down
+
     def __init__(self, root: tk.Tk):
         """Initialize drop handler.
 
@@ -41,6 +56,7 @@ class DropHandler:
         self.root = root
         self._drop_queue: queue.Queue = queue.Queue()
         self._running = True
+        self._empty_polls = 0
 
         # State references (set by app)
         self._popup: Optional[tk.Toplevel] = None
@@ -50,7 +66,6 @@ class DropHandler:
         self._on_files_dropped: Optional[Callable[[List[str]], None]] = None
 
         # WM_DROPFILES state
-        self._original_wndproc = None
         self._wndproc_callback = None
 
     def configure(self,
@@ -116,24 +131,29 @@ class DropHandler:
 
         # Windows constants
         WM_DROPFILES = 0x0233
-        GWL_WNDPROC = -4
+        WM_NCDESTROY = 0x0082
+        DROP_SUBCLASS_ID = 1
 
-        # Function signatures
-        WNDPROC = ctypes.WINFUNCTYPE(ctypes.c_long, wintypes.HWND, wintypes.UINT,
-                                     wintypes.WPARAM, wintypes.LPARAM)
+        # Function signatures (LRESULT/UINT_PTR/DWORD_PTR are pointer-sized)
+        SUBCLASSPROC = ctypes.WINFUNCTYPE(ctypes.c_ssize_t, wintypes.HWND, wintypes.UINT,
+                                          wintypes.WPARAM, wintypes.LPARAM,
+                                          ctypes.c_size_t, ctypes.c_size_t)
 
-        user32 = ctypes.windll.user32
+        comctl32 = ctypes.windll.comctl32
         shell32 = ctypes.windll.shell32
 
-        # Get original window procedure
-        SetWindowLongPtrW = user32.SetWindowLongPtrW
-        SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, WNDPROC]
-        SetWindowLongPtrW.restype = WNDPROC
+        # comctl32 subclassing chains to the previous window procedure itself
+        SetWindowSubclass = comctl32.SetWindowSubclass
+        SetWindowSubclass.argtypes = [wintypes.HWND, SUBCLASSPROC, ctypes.c_size_t, ctypes.c_size_t]
+        SetWindowSubclass.restype = wintypes.BOOL
+
+        RemoveWindowSubclass = comctl32.RemoveWindowSubclass
+        RemoveWindowSubclass.argtypes = [wintypes.HWND, SUBCLASSPROC, ctypes.c_size_t]
+        RemoveWindowSubclass.restype = wintypes.BOOL
 
-        CallWindowProcW = user32.CallWindowProcW
-        CallWindowProcW.argtypes = [WNDPROC, wintypes.HWND, wintypes.UINT,
-                                    wintypes.WPARAM, wintypes.LPARAM]
-        CallWindowProcW.restype = ctypes.c_long
+        DefSubclassProc = comctl32.DefSubclassProc
+        DefSubclassProc.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        DefSubclassProc.restype = ctypes.c_ssize_t
 
         # DragQueryFileW
         DragQueryFileW = shell32.DragQueryFileW
@@ -143,46 +163,56 @@ class DropHandler:
         DragFinish = shell32.DragFinish
         DragFinish.argtypes = [wintypes.HANDLE]
 
-        def wndproc(hwnd_inner, msg, wparam, lparam):
-            if msg == WM_DROPFILES:
-                logging.info("WM_DROPFILES received!")
-                hdrop = wparam
-                try:
-                    # Get number of files
-                    file_count = DragQueryFileW(hdrop, 0xFFFFFFFF, None, 0)
-                    logging.info(f"Dropped {file_count} files")
-
-                    paths = []
-                    for i in range(file_count):
-                        # Get required buffer size
-                        length = DragQueryFileW(hdrop, i, None, 0)
-                        buffer = ctypes.create_unicode_buffer(length + 1)
-                        DragQueryFileW(hdrop, i, buffer, length + 1)
-                        paths.append(buffer.value)
-                        logging.info(f"  File {i}: {buffer.value}")
+        def subclass_proc(hwnd_inner, msg, wparam, lparam, subclass_id, ref_data):
+            # Every window message passes through here; hand non-drop messages
+            # straight back to the default chain before doing anything else
+            if msg != WM_DROPFILES:
+                if msg == WM_NCDESTROY:
+                    # Window is going away: the subclass must be removed here.
+                    # The callback stays referenced (self._wndproc_callback)
+                    # since it is still running.
+                    RemoveWindowSubclass(hwnd_inner, self._wndproc_callback, subclass_id)
+                return DefSubclassProc(hwnd_inner, msg, wparam, lparam)
+
+            logging.info("WM_DROPFILES received!")
+            hdrop = wparam
+            try:
+                # Get number of files
+                file_count = DragQueryFileW(hdrop, 0xFFFFFFFF, None, 0)
+                logging.info(f"Dropped {file_count} files")
 
-                    DragFinish(hdrop)
+                paths = []
+                for i in range(file_count):
+                    # Get required buffer size
+                    length = DragQueryFileW(hdrop, i, None, 0)
+                    buffer = ctypes.create_unicode_buffer(length + 1)
+                    DragQueryFileW(hdrop, i, buffer, length + 1)
+                    paths.append(buffer.value)
+                    logging.info(f"  File {i}: {buffer.value}")
 
-                    # Process files on main thread
-                    if paths:
-                        self.root.after(0, lambda p=paths: self._process_dropped_files(p))
+                DragFinish(hdrop)
 
-                except Exception as e:
-                    logging.error(f"Error processing WM_DROPFILES: {e}")
-                    import traceback
-                    traceback.print_exc()
+                # Process files on main thread
+                if paths:
+                    self.root.after(0, lambda p=paths: self._process_dropped_files(p))
 
-                return 0
+            except Exception as e:
+                logging.error(f"Error processing WM_DROPFILES: {e}")
+                import traceback
+                traceback.print_exc()
 
-            # Call original window procedure
-            return CallWindowProcW(self._original_wndproc, hwnd_inner, msg, wparam, lparam)
+            return 0
 
-        # Keep reference to prevent garbage collection
-        self._wndproc_callback = WNDPROC(wndproc)
+        # Keep reference to prevent garbage collection while the subclass is
+        # installed (it is removed on WM_NCDESTROY)
+        self._wndproc_callback = SUBCLASSPROC(subclass_proc)
 
         # Subclass the window
-        self._original_wndproc = SetWindowLongPtrW(hwnd, GWL_WNDPROC, self._wndproc_callback)
-        logging.info(f"Window subclassed, original wndproc: {self._original_wndproc}")
+        if SetWindowSubclass(hwnd, self._wndproc_callback, DROP_SUBCLASS_ID, 0):
+            logging.info(f"Window {hwnd} subclassed for WM_DROPFILES")
+        else:
+            self._wndproc_callback = None
+            logging.warning(f"Failed to subclass window {hwnd} for WM_DROPFILES")
 
     def _on_tkdnd_drop(self, event):
         """Handle file drops via tkinterdnd2.
@@ -196,31 +226,7 @@ class DropHandler:
             return
 
         # Parse file paths from tkinterdnd2 format
-        raw_data = event.data
-        paths = []
-
-        if '{' in raw_data:
-            # Parse braced paths (handles paths with spaces)
-            current = ""
-            in_brace = False
-            for char in raw_data:
-                if char == '{':
-                    in_brace = True
-                elif char == '}':
-                    in_brace = False
-                    if current:
-                        paths.append(current)
-                        current = ""
-                elif char == ' ' and not in_brace:
-                    if current:
-                        paths.append(current)
-                        current = ""
-                else:
-                    current += char
-            if current:
-                paths.append(current)
-        else:
-            paths = raw_data.split()
+        paths = parse_tkdnd_paths(event.data)
 
         logging.info(f"Parsed paths: {paths}")
         self._process_dropped_files(paths)
@@ -274,12 +280,22 @@ class DropHandler:
             self._show_upload_disabled_warning()
             return
 
-        for path in paths:
+        add_files = getattr(self._attachment_area, 'add_files', None)
+        if add_files:
+            # Bulk add refreshes the attachment area once for the whole drop
             try:
-                result = self._attachment_area.add_file(path, show_warning=True)
-                logging.info(f"add_file result for {path}: {result}")
+                results = add_files(paths, show_warning=True)
+                for path, result in zip(paths, results):
+                    logging.info(f"add_file result for {path}: {result}")
             except Exception as e:
-                logging.warning(f"Error adding dropped file {path}: {e}")
+                logging.warning(f"Error adding dropped files: {e}")
+        else:
+            for path in paths:
+                try:
+                    result = self._attachment_area.add_file(path, show_warning=True)
+                    logging.info(f"add_file result for {path}: {result}")
+                except Exception as e:
+                    logging.warning(f"Error adding dropped file {path}: {e}")
 
         # Call callback if set
         if self._on_files_dropped:
@@ -308,14 +324,19 @@ class DropHandler:
             )
 
     def check_drop_queue(self):
-        """Check drop queue for files (runs on main Tkinter thread)."""
+        """Check drop queue for files (runs on main Tkinter thread).
+
+        windnd callbacks must not touch Tkinter, so the queue is polled. The
+        poll interval drops back to QUEUE_POLL_IDLE_MS when nothing arrives.
+        """
         try:
             while True:
                 paths = self._drop_queue.get_nowait()
                 logging.info(f"Processing drop queue: {len(paths)} files")
+                self._empty_polls = 0
                 self._process_dropped_files(paths)
         except queue.Empty:
-            pass
+            self._empty_polls += 1
         except Exception as e:
             logging.error(f"Error checking drop queue: {e}")
             import traceback
@@ -325,7 +346,11 @@ class DropHandler:
         if self._running and self._popup:
             try:
                 if self._popup.winfo_exists():
-                    self.root.after(50, self.check_drop_queue)
+                    if self._empty_polls < self.QUEUE_IDLE_AFTER_POLLS:
+                        delay = self.QUEUE_POLL_ACTIVE_MS
+                    else:
+                        delay = self.QUEUE_POLL_IDLE_MS
+                    self.root.after(delay, self.check_drop_queue)
             except tk.TclError:
                 pass
             except Exception as e:
@@ -334,6 +359,7 @@ class DropHandler:
     def start_queue_checker(self):
         """Start the drop queue checker loop."""
         self._running = True
+        self._empty_polls = 0
         self.check_drop_queue()
 
     def stop(self):
@@ -0,0 +1,33 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson parses and emits JSON several times faster than the stdlib and
+works on bytes directly. It is optional: without it these helpers fall
+back to the json module with the same results.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from UTF-8 bytes or str.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error type
+    subclasses it).
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
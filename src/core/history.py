@@ -2,18 +2,100 @@
 History Manager for CrossTrans.
 Handles saving, retrieving, and managing translation history.
 """
+import logging
+import queue
+import re
+import threading
 import time
 import uuid
-from typing import List, Dict, Any
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional
+
+# Character classes for language detection (scanned by the regex engine in C)
+# Both cases are listed so callers don't have to lowercase the whole text
+_VIETNAMESE_LOWER = 'àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵđ'
+_VIETNAMESE_CHARS = _VIETNAMESE_LOWER + _VIETNAMESE_LOWER.upper()
+_CJK_RE = re.compile('[\u4e00-\u9fff]')
+_KANA_RE = re.compile('[\u3040-\u30ff]')  # Hiragana + Katakana
+_KOREAN_RE = re.compile('[\uac00-\ud7af]')
+_VIETNAMESE_RE = re.compile('[' + _VIETNAMESE_CHARS + ']')
+_CYRILLIC_RE = re.compile('[\u0400-\u04ff]')
+_CLASSIFIED_RE = re.compile(
+    '[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af\u0400-\u04ff' + _VIETNAMESE_CHARS + ']'
+)
 
 
 class HistoryManager:
     """Manages translation history with a limit on entries."""
     
     MAX_HISTORY = 100
+    PERSIST_DELAY = 0.2  # Seconds to wait for more changes before writing
+    _STOP = object()
 
     def __init__(self, config):
         self.config = config
+        # Newest-first in-memory copy, loaded from config on first use
+        self._history: Optional[Deque[Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        # Changes are written to config by a background thread
+        self._persist_queue: queue.Queue = queue.Queue()
+        self._persist_thread: Optional[threading.Thread] = None
+
+    def _entries(self) -> Deque[Dict[str, Any]]:
+        """Get the in-memory history, loading it from config if needed."""
+        if self._history is None:
+            self._history = deque(self.config.get('history') or [], maxlen=self.MAX_HISTORY)
+        return self._history
+
+    def _schedule_persist(self):
+        """Queue a write of the current history to config."""
+        with self._lock:
+            if self._persist_thread is None or not self._persist_thread.is_alive():
+                self._persist_thread = threading.Thread(
+                    target=self._persist_worker, daemon=True, name="history-writer")
+                self._persist_thread.start()
+            self._persist_queue.put(True)
+
+    def _persist_worker(self):
+        """Write history to config, coalescing changes that arrive close together."""
+        while True:
+            item = self._persist_queue.get()
+            pending = 1
+            stop = item is self._STOP
+            while not stop:
+                try:
+                    item = self._persist_queue.get(timeout=self.PERSIST_DELAY)
+                except queue.Empty:
+                    break
+                pending += 1
+                stop = item is self._STOP
+
+            try:
+                with self._lock:
+                    snapshot = list(self._entries())
+                self.config.set('history', snapshot)
+            except Exception as e:
+                logging.error(f"Failed to save history: {e}")
+            finally:
+                for _ in range(pending):
+                    self._persist_queue.task_done()
+
+            if stop:
+                return
+
+    def flush(self):
+        """Block until all queued history changes have been written."""
+        if self._persist_thread is not None and self._persist_thread.is_alive():
+            self._persist_queue.join()
+
+    def close(self, timeout: float = 2.0):
+        """Write pending changes and stop the background writer."""
+        with self._lock:
+            thread = self._persist_thread
+            if thread is None or not thread.is_alive():
+                return
+            self._persist_queue.put(self._STOP)
+        thread.join(timeout)
 
     def add_entry(self, original: str, translated: str, target_lang: str,
                   source_type: str = "text", model_used: str = "Auto",
@@ -41,69 +123,51 @@ class HistoryManager:
             'model_used': model_used
         }
 
-        history = self.config.get('history', [])
-        history.insert(0, entry)
-        
-        # Enforce limit
-        if len(history) > self.MAX_HISTORY:
-            history = history[:self.MAX_HISTORY]
-            
-        self.config.set('history', history)
+        # maxlen drops the oldest entry once the limit is reached
+        with self._lock:
+            self._entries().appendleft(entry)
+        self._schedule_persist()
 
     def get_history(self) -> List[Dict[str, Any]]:
         """Get full history list."""
-        return self.config.get('history', [])
+        with self._lock:
+            return list(self._entries())
 
     def clear_history(self):
         """Clear all history."""
-        self.config.set('history', [])
+        with self._lock:
+            self._history = deque(maxlen=self.MAX_HISTORY)
+        self._schedule_persist()
 
     def delete_entry(self, entry_id: str):
         """Delete a specific entry by ID."""
-        history = self.config.get('history', [])
-        history = [h for h in history if h.get('id') != entry_id]
-        self.config.set('history', history)
+        with self._lock:
+            self._history = deque((h for h in self._entries() if h.get('id') != entry_id),
+                                  maxlen=self.MAX_HISTORY)
+        self._schedule_persist()
 
     def _detect_language(self, text: str) -> str:
         """Simple language detection based on character ranges."""
         if not text:
             return "Unknown"
 
+        # Any kana decides Japanese, so stop at the first one
+        if _KANA_RE.search(text):
+            return "Japanese"
+
         # Count characters in different ranges
-        cjk = 0  # Chinese/Japanese/Korean
-        hiragana = 0
-        katakana = 0
-        korean = 0
-        vietnamese = 0
-        latin = 0
-        cyrillic = 0
-
-        vietnamese_chars = set('àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵđ')
-
-        for char in text.lower():
-            code = ord(char)
-            if 0x4E00 <= code <= 0x9FFF:  # CJK
-                cjk += 1
-            elif 0x3040 <= code <= 0x309F:  # Hiragana
-                hiragana += 1
-            elif 0x30A0 <= code <= 0x30FF:  # Katakana
-                katakana += 1
-            elif 0xAC00 <= code <= 0xD7AF:  # Korean
-                korean += 1
-            elif char in vietnamese_chars:
-                vietnamese += 1
-            elif 0x0400 <= code <= 0x04FF:  # Cyrillic
-                cyrillic += 1
-            elif char.isalpha():
-                latin += 1
+        cjk = len(_CJK_RE.findall(text))  # Chinese/Japanese/Korean
+        korean = len(_KOREAN_RE.findall(text))
+        vietnamese = len(_VIETNAMESE_RE.findall(text))
+        cyrillic = len(_CYRILLIC_RE.findall(text))
+        # Any other letter counts as Latin
+        latin = sum(map(str.isalpha, _CLASSIFIED_RE.sub('', text)))
 
         # Determine language
-        total = cjk + hiragana + katakana + korean + vietnamese + latin + cyrillic
+        total = cjk + korean + vietnamese + latin + cyrillic
         if total == 0:
             return "Unknown"
 
-        if hiragana + katakana > 0:
-            return "Japanese"
         if korean > total * 0.3:
             return "Korean"
         if cjk > total * 0.3:
@@ -0,0 +1,243 @@
+"""
+Keep-alive HTTPS connections for small JSON API calls.
+
+urllib.request.urlopen opens a new TCP + TLS connection for every call.
+Remote config and trial translations hit the same host, so idle
+connections are kept per host and reused for the next request.
+Errors are raised as urllib.error.HTTPError / URLError so callers keep
+their existing error handling.
+
+Like urlopen, connections go through the HTTPS proxy from
+urllib.request.getproxies() (environment or Windows settings) via a
+CONNECT tunnel, and GET redirects are followed.
+"""
+import base64
+import http.client
+import io
+import logging
+import select
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+from src.core.ssl_pinning import get_ssl_context_for_url
+
+# Idle connections kept per (host, port)
+MAX_IDLE_PER_HOST = 4
+
+_idle: Dict[Tuple[str, int], List[http.client.HTTPSConnection]] = {}
+_idle_lock = threading.Lock()
+
+# Redirects followed for GET requests (other methods raise HTTPError)
+MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Raised when the server already closed a kept-alive connection
+# (SSLError covers a TLS EOF on a socket the server dropped)
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+    ssl.SSLError,
+)
+
+# Methods safe to resend if the connection drops after the request went out
+_IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _get_proxy(host: str) -> Optional[Tuple[str, int, Dict[str, str]]]:
+    """Return (proxy host, proxy port, CONNECT headers) for host, or None.
+
+    Uses the same proxy settings and bypass list as urlopen.
+    """
+    proxy = urllib.request.getproxies().get('https')
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urlsplit(proxy)
+    if not parts.hostname:
+        return None
+
+    headers = {}
+    if parts.username:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+        headers['Proxy-Authorization'] = f"Basic {token}"
+    return parts.hostname, parts.port or 80, headers
+
+
+def _connect(key: Tuple[str, int], url: str,
+             timeout: float) -> http.client.HTTPSConnection:
+    """Open a new pinned-TLS connection (the handshake happens on first use).
+
+    Behind a proxy the connection is tunnelled with CONNECT; TLS and
+    certificate pinning still apply to the target host.
+    """
+    context = get_ssl_context_for_url(url)
+    proxy = _get_proxy(key[0])
+    if proxy is None:
+        return http.client.HTTPSConnection(
+            key[0], key[1], timeout=timeout, context=context
+        )
+
+    proxy_host, proxy_port, proxy_headers = proxy
+    conn = http.client.HTTPSConnection(
+        proxy_host, proxy_port, timeout=timeout, context=context
+    )
+    conn.set_tunnel(key[0], key[1], headers=proxy_headers)
+    return conn
+
+
+def _acquire(key: Tuple[str, int], url: str,
+             timeout: float) -> Tuple[http.client.HTTPSConnection, bool]:
+    """Return (connection, reused) for a host, reusing an idle one if any."""
+    with _idle_lock:
+        pool = _idle.get(key)
+        conn = pool.pop() if pool else None
+    if conn is not None and _is_dropped(conn):
+        conn.close()
+        conn = None
+    if conn is None:
+        return _connect(key, url, timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _is_dropped(conn: http.client.HTTPSConnection) -> bool:
+    """Check whether the server has closed an idle connection.
+
+    An idle keep-alive socket should have nothing to read; if it is
+    readable the server sent EOF (or unexpected data), so it can't be reused.
+    """
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _release(key: Tuple[str, int], conn: http.client.HTTPSConnection) -> None:
+    """Return a connection to the idle pool, or close it if the pool is full."""
+    with _idle_lock:
+        pool = _idle.setdefault(key, [])
+        if len(pool) < MAX_IDLE_PER_HOST:
+            pool.append(conn)
+            return
+    conn.close()
+
+
+def _read_body(response: http.client.HTTPResponse,
+               max_bytes: Optional[int]) -> Optional[bytes]:
+    """Read the response body, or return None if it is larger than max_bytes."""
+    if max_bytes is None:
+        return response.read()
+    length = response.getheader('Content-Length')
+    if length and length.isdigit() and int(length) > max_bytes:
+        return None
+    data = response.read(max_bytes + 1)
+    return data if len(data) <= max_bytes else None
+
+
+def _send(method: str, url: str, body: Optional[bytes],
+          headers: Optional[Dict[str, str]], timeout: float,
+          max_bytes: Optional[int]) -> Tuple[http.client.HTTPResponse, bytes]:
+    """Send one request and read the response, without following redirects."""
+    parts = urlsplit(url)
+    if parts.scheme != 'https':
+        raise urllib.error.URLError(f"Unsupported URL scheme: {parts.scheme}")
+    key = (parts.hostname, parts.port or 443)
+    path = parts.path or '/'
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    conn, reused = _acquire(key, url, timeout)
+    try:
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+        except _STALE_ERRORS:
+            if not reused:
+                raise
+            # Server dropped the idle connection before the request got
+            # through; send it again on a fresh one
+            logging.debug(f"[HTTP] Stale connection to {key[0]}, reconnecting")
+            conn.close()
+            conn = _connect(key, url, timeout)
+            reused = False
+            conn.request(method, path, body=body, headers=headers or {})
+
+        try:
+            response = conn.getresponse()
+        except _STALE_ERRORS:
+            # The request may already have been processed (e.g. a trial
+            # translation charged to the quota), so only resend idempotent ones
+            if not reused or method not in _IDEMPOTENT_METHODS:
+                raise
+            logging.debug(f"[HTTP] Connection to {key[0]} dropped, resending {method}")
+            conn.close()
+            conn = _connect(key, url, timeout)
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+        data = _read_body(response, max_bytes)
+    except (OSError, http.client.HTTPException) as e:
+        conn.close()
+        raise urllib.error.URLError(e) from e
+
+    if data is None:
+        conn.close()
+        raise urllib.error.URLError(f"Response from {key[0]} exceeds {max_bytes} bytes")
+
+    # Only a fully read response leaves the connection ready for reuse
+    if response.will_close or not response.isclosed():
+        conn.close()
+    else:
+        _release(key, conn)
+
+    return response, data
+
+
+def request(method: str, url: str, body: Optional[bytes] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: float = 30,
+            max_bytes: Optional[int] = None) -> Tuple[int, bytes]:
+    """Send an HTTPS request over a pooled keep-alive connection.
+
+    Args:
+        method: HTTP method ('GET', 'POST', ...).
+        url: Full https:// URL.
+        body: Optional request body.
+        headers: Optional request headers.
+        timeout: Socket timeout in seconds.
+        max_bytes: Optional limit on the response body size; larger bodies
+            are rejected without being read in full.
+
+    Returns:
+        Tuple of (status code, response body).
+
+    Raises:
+        urllib.error.HTTPError: For 4xx/5xx responses, and for redirects that
+            are not followed (non-GET requests, too many redirects).
+        urllib.error.URLError: If the connection fails or the body is too large.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        response, data = _send(method, url, body, headers, timeout, max_bytes)
+        location = response.getheader('Location')
+        if method != 'GET' or response.status not in _REDIRECT_CODES or not location:
+            break
+        url = urljoin(url, location)
+        logging.debug(f"[HTTP] Following {response.status} redirect to {url}")
+
+    if response.status >= 300:
+        raise urllib.error.HTTPError(
+            url, response.status, response.reason,
+            response.headers, io.BytesIO(data)
+        )
+    return response.status, data
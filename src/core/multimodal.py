@@ -3,12 +3,90 @@ Multimodal Processing Module for CrossTrans.
 Handles image encoding and vision model capabilities.
 """
 import base64
+import functools
+import io
 import mimetypes
 import os
 import fnmatch
-from typing import Tuple, Optional
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, Pattern, Tuple, Optional
 from src.core.remote_config import get_config
 
+# Read size for base64 encoding; a multiple of 3 so chunks concatenate without padding
+ENCODE_CHUNK_SIZE = 57 * 1024
+# Larger images are encoded on every call rather than kept in the cache
+MAX_CACHED_IMAGE_SIZE = 4 * 1024 * 1024
+# Total base64 characters kept in the cache; least recently used entries go first
+MAX_ENCODE_CACHE_BYTES = 16 * 1024 * 1024
+
+_encode_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_encode_cache_bytes = 0
+_encode_cache_lock = threading.Lock()
+
+
+def _encode_file(path: str) -> str:
+    """Base64-encode a file's contents.
+
+    Streaming avoids holding the raw file next to its encoding: peak memory
+    is about 2.7x the file size (the buffer plus the returned str), down
+    from 3x for read() + b64encode().
+    """
+    buffer = io.BytesIO()
+    with open(path, "rb") as image_file:
+        while chunk := image_file.read(ENCODE_CHUNK_SIZE):
+            buffer.write(base64.b64encode(chunk))
+    return buffer.getvalue().decode('ascii')
+
+
+def _encode_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Cached _encode_file; mtime and size in the key invalidate edited files."""
+    global _encode_cache_bytes
+    key = (path, mtime_ns, size)
+    with _encode_cache_lock:
+        encoded = _encode_cache.get(key)
+        if encoded is not None:
+            _encode_cache.move_to_end(key)
+            return encoded
+
+    encoded = _encode_file(path)
+    with _encode_cache_lock:
+        if key not in _encode_cache:
+            _encode_cache[key] = encoded
+            _encode_cache_bytes += len(encoded)
+            while _encode_cache_bytes > MAX_ENCODE_CACHE_BYTES:
+                _, evicted = _encode_cache.popitem(last=False)
+                _encode_cache_bytes -= len(evicted)
+    return encoded
+
+
+_watching_config = False
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_provider_patterns(provider: str) -> Optional[Tuple[FrozenSet[str], Optional[Pattern]]]:
+    """Split a provider's vision models into exact names and one compiled glob regex.
+
+    Returns None if the provider has no vision models listed. The cache is
+    cleared whenever the remote config is updated.
+    """
+    global _watching_config
+    if not _watching_config:
+        get_config().register_update_callback(_compile_provider_patterns.cache_clear)
+        _watching_config = True
+
+    vision_models = get_config().vision_models
+    if provider not in vision_models:
+        return None
+
+    models = vision_models[provider]
+    exact = frozenset(m for m in models if '*' not in m)
+    # Wildcards match case-insensitively, as fnmatch does on Windows
+    globs = [fnmatch.translate(m.lower()) for m in models if '*' in m]
+    return exact, (re.compile('|'.join(globs)) if globs else None)
+
 
 class MultimodalProcessor:
     """Handles image processing and vision capabilities."""
@@ -18,20 +96,15 @@ class MultimodalProcessor:
         """Check if a model supports vision."""
         provider = provider.lower()
         model_name = model_name.lower()
-        
-        vision_models = get_config().vision_models
-        if provider not in vision_models:
+
+        patterns = _compile_provider_patterns(provider)
+        if patterns is None:
             return False
 
-        models = vision_models[provider]
-        for m in models:
-            # Handle wildcards
-            if '*' in m:
-                if fnmatch.fnmatch(model_name, m):
-                    return True
-            elif m == model_name:
-                return True
-                
+        exact, glob_re = patterns
+        if model_name in exact or (glob_re is not None and glob_re.match(model_name)):
+            return True
+
         # Heuristics for models not explicitly listed but likely vision
         if 'vision' in model_name or 'pixtral' in model_name:
             return True
@@ -49,8 +122,13 @@ class MultimodalProcessor:
             mime_type = 'image/jpeg'
             
         try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
+            stat = os.stat(image_path)
+            path = os.path.abspath(image_path)
+            # Screenshots are one-off temp files: caching them only evicts useful entries
+            if stat.st_size > MAX_CACHED_IMAGE_SIZE or os.path.dirname(path) == tempfile.gettempdir():
+                encoded_string = _encode_file(image_path)
+            else:
+                encoded_string = _encode_cached(path, stat.st_mtime_ns, stat.st_size)
             return encoded_string, mime_type
         except Exception as e:
             print(f"Error encoding image: {e}")
@@ -8,8 +8,8 @@ import os
 import uuid
 import hashlib
 import logging
+import weakref
 from datetime import date
-from typing import Optional
 
 
 class QuotaManager:
@@ -17,6 +17,10 @@ class QuotaManager:
 
     DAILY_LIMIT = 100  # Maximum translations per day in trial mode
 
+    # Device IDs resolved per config object, shared by all managers using it
+    # (uuid.getnode() can be slow on Windows)
+    _device_ids: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
     def __init__(self, config):
         """Initialize QuotaManager.
 
@@ -24,14 +28,15 @@ class QuotaManager:
             config: ConfigManager instance for persistent storage.
         """
         self.config = config
-        self._device_id: Optional[str] = None
 
     @property
     def device_id(self) -> str:
         """Get or create unique device ID."""
-        if self._device_id is None:
-            self._device_id = self._get_or_create_device_id()
-        return self._device_id
+        device_id = QuotaManager._device_ids.get(self.config)
+        if device_id is None:
+            device_id = self._get_or_create_device_id()
+            QuotaManager._device_ids[self.config] = device_id
+        return device_id
 
     def _get_or_create_device_id(self) -> str:
         """Get existing device ID or create a new one.
@@ -94,12 +99,12 @@ class QuotaManager:
                 'is_exhausted': bool
             }
         """
-        quota = self._get_or_create_quota()
+        quota = self._load_quota()
         today = date.today().isoformat()
 
-        # Check if quota needs reset (new day)
+        # A new day starts from a fresh quota (saved on the next use_quota)
         if quota.get('reset_date') != today:
-            quota = self._reset_quota()
+            quota = self._new_day_quota(quota)
 
         remaining = max(0, self.DAILY_LIMIT - quota.get('used_today', 0))
 
@@ -128,15 +133,19 @@ class QuotaManager:
         Returns:
             bool: True if quota was available and used, False if exhausted.
         """
-        quota_info = self.get_quota_info()
-
-        if quota_info['remaining'] < count:
-            logging.warning(f"Trial quota exhausted. Used: {quota_info['used_today']}/{self.DAILY_LIMIT}")
+        # Single read-modify-write of the stored quota
+        quota = self._load_quota()
+        if quota.get('reset_date') != date.today().isoformat():
+            quota = self._new_day_quota(quota)
+            logging.info("Trial quota reset for new day")
+
+        used = quota.get('used_today', 0)
+        if self.DAILY_LIMIT - used < count:
+            logging.warning(f"Trial quota exhausted. Used: {used}/{self.DAILY_LIMIT}")
             return False
 
-        # Update quota
-        quota = self._get_or_create_quota()
-        quota['used_today'] = quota.get('used_today', 0) + count
+        quota['used_today'] = used + count
+        quota['device_id'] = self.device_id
         self.config.set('trial_quota', quota)
 
         logging.debug(f"Trial quota used: {quota['used_today']}/{self.DAILY_LIMIT}")
@@ -150,40 +159,32 @@ class QuotaManager:
         """
         return self.get_remaining_quota() > 0
 
-    def _get_or_create_quota(self) -> dict:
-        """Get existing quota data or create default."""
+    def _load_quota(self) -> dict:
+        """Get stored quota data, or a default one.
+
+        Nothing is written here; use_quota is the only place the quota is saved,
+        so reading quota info never touches the config file.
+        """
         quota = self.config.get('trial_quota')
 
         if not quota or not isinstance(quota, dict):
-            quota = self._create_default_quota()
-            self.config.set('trial_quota', quota)
+            quota = self._new_day_quota({})
 
         return quota
 
-    def _create_default_quota(self) -> dict:
-        """Create default quota structure."""
-        return {
-            'daily_limit': self.DAILY_LIMIT,
-            'used_today': 0,
-            'reset_date': date.today().isoformat(),
-            'device_id': self.device_id,
-            'first_use_date': date.today().isoformat()
-        }
+    def _new_day_quota(self, previous: dict) -> dict:
+        """Build a fresh quota for today, keeping the first use date.
 
-    def _reset_quota(self) -> dict:
-        """Reset quota for a new day."""
-        quota = {
+        The device ID is added by use_quota when the quota is saved, so
+        reading quota info never has to create (and store) one.
+        """
+        today = date.today().isoformat()
+        return {
             'daily_limit': self.DAILY_LIMIT,
             'used_today': 0,
-            'reset_date': date.today().isoformat(),
-            'device_id': self.device_id,
-            'first_use_date': self.config.get('trial_quota', {}).get(
-                'first_use_date', date.today().isoformat()
-            )
+            'reset_date': today,
+            'first_use_date': previous.get('first_use_date', today)
         }
-        self.config.set('trial_quota', quota)
-        logging.info("Trial quota reset for new day")
-        return quota
 
     def get_quota_message(self) -> str:
         """Get a user-friendly message about quota status.
@@ -8,25 +8,42 @@ Architecture (3-tier fallback):
   Tier 2: Local cache file (%APPDATA%/AITranslator/models_config.json)
   Tier 3: Hardcoded defaults in constants.py
 """
-import json
+import functools
+import inspect
 import os
 import time
 import logging
 import threading
-import urllib.request
-import urllib.error
-from typing import Dict, List, Optional, Any, Callable
+import weakref
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Callable, Sequence
 
 from src.constants import (
     MODEL_PROVIDER_MAP as _HARDCODED_MODEL_PROVIDER_MAP,
     PROVIDERS_LIST as _HARDCODED_PROVIDERS_LIST,
     API_KEY_PATTERNS as _HARDCODED_API_KEY_PATTERNS,
     VISION_MODELS as _HARDCODED_VISION_MODELS,
+    DEFAULT_MODELS_BY_PROVIDER as _HARDCODED_DEFAULTS,
 )
+from src.core import fast_json
 
 # Supported remote config schema versions
 SUPPORTED_SCHEMA_VERSIONS = {2}
 
+# Remote config bodies larger than this are rejected unread
+REMOTE_CONFIG_MAX_BYTES = 1024 * 1024
+
+# Required top-level keys and their expected JSON types
+_SCHEMA = {
+    'providers_list': list,
+    'model_provider_map': dict,
+    'api_key_patterns': dict,
+    'vision_models': dict,
+    'default_models_by_provider': dict,
+    'provider_api_urls': dict,
+}
+
 # Cache file location
 _APPDATA = os.environ.get('APPDATA', os.path.expanduser('~'))
 CACHE_DIR = os.path.join(_APPDATA, 'AITranslator')
@@ -34,34 +51,66 @@ CACHE_FILE = os.path.join(CACHE_DIR, 'models_config.json')
 
 logger = logging.getLogger(__name__)
 
+# Immutable view of the active config, rebuilt whenever the config is replaced
+_Snapshot = namedtuple('_Snapshot', [
+    'providers_list', 'model_provider_map', 'api_key_patterns', 'vision_models',
+    'default_models_by_provider', 'provider_api_urls', 'source', 'updated_at',
+])
+
+
+def _freeze_map(mapping: Mapping) -> Mapping:
+    """Return a read-only copy of a mapping, turning list values into tuples."""
+    return MappingProxyType({
+        k: tuple(v) if isinstance(v, list) else v for k, v in mapping.items()
+    })
+
+
+def _strong_ref(obj: Any) -> Callable[[], Any]:
+    """Wrap obj in a weakref-like callable that always returns it."""
+    return lambda: obj
+
+
+@functools.lru_cache(maxsize=1)
+def _build_hardcoded_defaults() -> Mapping[str, Any]:
+    """Build a read-only config from constants.py hardcoded values (once per process)."""
+    return MappingProxyType({
+        "version": 2,
+        "updated_at": "",
+        "providers_list": tuple(_HARDCODED_PROVIDERS_LIST),
+        "model_provider_map": _freeze_map(_HARDCODED_MODEL_PROVIDER_MAP),
+        "api_key_patterns": _freeze_map(_HARDCODED_API_KEY_PATTERNS),
+        "vision_models": _freeze_map(_HARDCODED_VISION_MODELS),
+        "default_models_by_provider": _freeze_map(_HARDCODED_DEFAULTS),
+        "provider_api_urls": MappingProxyType({
+            'OpenAI': "https://api.openai.com/v1/chat/completions",
+            'Groq': "https://api.groq.com/openai/v1/chat/completions",
+            'DeepSeek': "https://api.deepseek.com/chat/completions",
+            'Mistral': "https://api.mistral.ai/v1/chat/completions",
+            'xAI': "https://api.x.ai/v1/chat/completions",
+            'Perplexity': "https://api.perplexity.ai/chat/completions",
+            'Cerebras': "https://api.cerebras.ai/v1/chat/completions",
+            'SambaNova': "https://api.sambanova.ai/v1/chat/completions",
+            'Together': "https://api.together.xyz/v1/chat/completions",
+            'SiliconFlow': "https://api.siliconflow.cn/v1/chat/completions",
+            'OpenRouter': "https://openrouter.ai/api/v1/chat/completions",
+            'HuggingFace': "https://router.huggingface.co/v1/chat/completions",
+        }),
+        "_source": "hardcoded",
+    })
+
 
 class RemoteConfigManager:
     """Manages remote model/provider configuration with local caching.
 
-    Singleton - use get_config() to access.
+    Singleton - created once at import, use get_config() to access.
     Thread-safe for concurrent reads from UI and background fetch.
     """
 
-    _instance: Optional['RemoteConfigManager'] = None
-    _instance_lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._instance_lock:
-                if cls._instance is None:
-                    inst = super().__new__(cls)
-                    inst._initialized = False
-                    cls._instance = inst
-        return cls._instance
-
     def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
         self._config: Dict[str, Any] = {}
         self._config_lock = threading.RLock()
-        self._update_callbacks: List[Callable] = []
-        self._fetching = False
+        self._update_callbacks: List[Callable[[], Optional[Callable]]] = []
+        self._refreshing = threading.Event()
         self._load_cached_or_defaults()
 
     # ------------------------------------------------------------------ #
@@ -75,44 +124,42 @@ class RemoteConfigManager:
             self._config = cached
             logger.info("[RemoteConfig] Loaded config from local cache")
         else:
-            self._config = self._build_hardcoded_defaults()
+            self._config = dict(_build_hardcoded_defaults())
             logger.info("[RemoteConfig] Using hardcoded defaults")
+        self._rebuild_snapshot()
+
+    def _rebuild_snapshot(self):
+        """Build the read-only snapshot served by the accessor properties.
 
-    def _build_hardcoded_defaults(self) -> Dict[str, Any]:
-        """Build config dict from constants.py hardcoded values."""
-        from src.core.api_manager import DEFAULT_MODELS_BY_PROVIDER as _HARDCODED_DEFAULTS
-
-        return {
-            "version": 2,
-            "updated_at": "",
-            "providers_list": list(_HARDCODED_PROVIDERS_LIST),
-            "model_provider_map": {k: list(v) for k, v in _HARDCODED_MODEL_PROVIDER_MAP.items()},
-            "api_key_patterns": dict(_HARDCODED_API_KEY_PATTERNS),
-            "vision_models": {k: list(v) for k, v in _HARDCODED_VISION_MODELS.items()},
-            "default_models_by_provider": {k: list(v) for k, v in _HARDCODED_DEFAULTS.items()},
-            "provider_api_urls": {
-                'OpenAI': "https://api.openai.com/v1/chat/completions",
-                'Groq': "https://api.groq.com/openai/v1/chat/completions",
-                'DeepSeek': "https://api.deepseek.com/chat/completions",
-                'Mistral': "https://api.mistral.ai/v1/chat/completions",
-                'xAI': "https://api.x.ai/v1/chat/completions",
-                'Perplexity': "https://api.perplexity.ai/chat/completions",
-                'Cerebras': "https://api.cerebras.ai/v1/chat/completions",
-                'SambaNova': "https://api.sambanova.ai/v1/chat/completions",
-                'Together': "https://api.together.xyz/v1/chat/completions",
-                'SiliconFlow': "https://api.siliconflow.cn/v1/chat/completions",
-                'OpenRouter': "https://openrouter.ai/api/v1/chat/completions",
-                'HuggingFace': "https://router.huggingface.co/v1/chat/completions",
-            },
-            "_source": "hardcoded",
-        }
+        Accessors read self._snapshot without locking; replacing the reference
+        is atomic, so readers see either the old or the new snapshot.
+        """
+        with self._config_lock:
+            config = self._config
+            self._snapshot = _Snapshot(
+                providers_list=tuple(config.get('providers_list', _HARDCODED_PROVIDERS_LIST)),
+                model_provider_map=_freeze_map(
+                    config.get('model_provider_map', _HARDCODED_MODEL_PROVIDER_MAP)),
+                api_key_patterns=_freeze_map(
+                    config.get('api_key_patterns', _HARDCODED_API_KEY_PATTERNS)),
+                vision_models=_freeze_map(config.get('vision_models', _HARDCODED_VISION_MODELS)),
+                # Empty remote values fall back to the hardcoded tables here, once
+                default_models_by_provider=_freeze_map(
+                    config.get('default_models_by_provider')
+                    or _build_hardcoded_defaults()['default_models_by_provider']),
+                provider_api_urls=_freeze_map(
+                    config.get('provider_api_urls')
+                    or _build_hardcoded_defaults()['provider_api_urls']),
+                source=config.get('_source', 'hardcoded'),
+                updated_at=config.get('updated_at', ''),
+            )
 
     def _read_cache_file(self) -> Optional[Dict]:
         """Read config from local cache file."""
         try:
             if os.path.exists(CACHE_FILE):
-                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(CACHE_FILE, 'rb') as f:
+                    return fast_json.loads(f.read())
         except Exception as e:
             logger.warning(f"[RemoteConfig] Failed to read cache file: {e}")
         return None
@@ -124,14 +171,17 @@ class RemoteConfigManager:
             data_with_meta = dict(data)
             data_with_meta['_cached_at'] = time.time()
             data_with_meta['_source'] = 'remote'
-            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data_with_meta, f, ensure_ascii=False, indent=2)
+            # Write to a temp file and swap it in, so a crash never leaves a half-written cache
+            tmp_path = CACHE_FILE + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(fast_json.dumps(data_with_meta, indent=True))
+            os.replace(tmp_path, CACHE_FILE)
             logger.info("[RemoteConfig] Saved config to local cache")
         except Exception as e:
             logger.warning(f"[RemoteConfig] Failed to save cache: {e}")
 
     def _is_cache_fresh(self) -> bool:
-        """Check if cached config is within TTL (24 hours)."""
+        """Check if cached config is within the refresh TTL."""
         from src.constants import REMOTE_CONFIG_CACHE_TTL
         cached_at = self._config.get('_cached_at', 0)
         if not cached_at:
@@ -143,18 +193,23 @@ class RemoteConfigManager:
     # ------------------------------------------------------------------ #
 
     def fetch_remote_async(self, force: bool = False):
-        """Fetch remote config in a background daemon thread.
+        """Revalidate the config in a background daemon thread.
+
+        Never blocks: accessors keep serving the current (possibly stale)
+        snapshot until the fetch completes. Calls made while a refresh is
+        already running are dropped.
 
         Args:
             force: If True, fetch even if cache is fresh
         """
-        if self._fetching:
-            return
         if not force and self._is_cache_fresh():
             logger.debug("[RemoteConfig] Cache is fresh, skipping remote fetch")
             return
 
-        self._fetching = True
+        with self._config_lock:
+            if self._refreshing.is_set():
+                return
+            self._refreshing.set()
         t = threading.Thread(target=self._fetch_remote_thread, daemon=True, name="remote-config")
         t.start()
 
@@ -167,6 +222,7 @@ class RemoteConfigManager:
                     self._config = data
                     self._config['_cached_at'] = time.time()
                     self._config['_source'] = 'remote'
+                    self._rebuild_snapshot()
                 self._save_cache(data)
                 logger.info("[RemoteConfig] Updated config from remote")
                 self._notify_callbacks()
@@ -175,33 +231,24 @@ class RemoteConfigManager:
         except Exception as e:
             logger.warning(f"[RemoteConfig] Remote fetch failed: {e}")
         finally:
-            self._fetching = False
+            self._refreshing.clear()
 
     def _fetch_remote(self) -> Optional[Dict]:
         """Fetch config JSON from Cloudflare Worker endpoint."""
         from src.constants import REMOTE_CONFIG_URL
 
         try:
-            req = urllib.request.Request(
-                REMOTE_CONFIG_URL,
+            from src.core import http_pool
+            _, raw = http_pool.request(
+                'GET', REMOTE_CONFIG_URL,
                 headers={
                     'User-Agent': 'CrossTrans-Config/1.0',
                     'Accept': 'application/json',
                 },
-                method='GET'
+                timeout=15,
+                max_bytes=REMOTE_CONFIG_MAX_BYTES
             )
-
-            # Use SSL context if available
-            ssl_context = None
-            try:
-                from src.core.ssl_pinning import get_ssl_context_for_url
-                ssl_context = get_ssl_context_for_url(REMOTE_CONFIG_URL)
-            except Exception:
-                pass
-
-            with urllib.request.urlopen(req, timeout=15, context=ssl_context) as response:
-                raw = response.read().decode('utf-8')
-                return json.loads(raw)
+            return fast_json.loads(raw)
 
         except Exception as e:
             logger.warning(f"[RemoteConfig] HTTP fetch error: {e}")
@@ -221,20 +268,16 @@ class RemoteConfigManager:
             logger.warning(f"[RemoteConfig] Unsupported schema version: {version}")
             return False
 
-        required_keys = [
-            'providers_list', 'model_provider_map', 'api_key_patterns',
-            'vision_models', 'default_models_by_provider', 'provider_api_urls'
-        ]
-        for key in required_keys:
-            if key not in data:
+        for key, expected_type in _SCHEMA.items():
+            value = data.get(key)
+            if value is None:
                 logger.warning(f"[RemoteConfig] Missing required key: {key}")
                 return False
+            if not isinstance(value, expected_type):
+                logger.warning(f"[RemoteConfig] Invalid type for key: {key}")
+                return False
 
-        if not isinstance(data['providers_list'], list) or len(data['providers_list']) < 2:
-            return False
-        if not isinstance(data['model_provider_map'], dict):
-            return False
-        if not isinstance(data['provider_api_urls'], dict):
+        if len(data['providers_list']) < 2:
             return False
 
         return True
@@ -244,78 +287,80 @@ class RemoteConfigManager:
     # ------------------------------------------------------------------ #
 
     def register_update_callback(self, callback: Callable):
-        """Register callback to be notified when config updates from remote."""
-        self._update_callbacks.append(callback)
+        """Register callback to be notified when config updates from remote.
+
+        Bound methods are held weakly, so a window that never unregisters
+        does not stay alive through this list.
+        """
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = _strong_ref(callback)
+        with self._config_lock:
+            self._update_callbacks.append(ref)
 
     def unregister_update_callback(self, callback: Callable):
         """Unregister a previously registered callback."""
-        try:
-            self._update_callbacks.remove(callback)
-        except ValueError:
-            pass
+        with self._config_lock:
+            self._update_callbacks = [
+                ref for ref in self._update_callbacks if ref() not in (None, callback)
+            ]
 
     def _notify_callbacks(self):
         """Notify all registered callbacks that config was updated."""
-        for cb in self._update_callbacks:
+        with self._config_lock:
+            refs = self._update_callbacks
+            self._update_callbacks = live = []
+            for ref in refs:
+                if ref() is not None:
+                    live.append(ref)
+
+        for ref in live:
+            cb = ref()
+            if cb is None:
+                continue
             try:
                 cb()
             except Exception as e:
                 logger.warning(f"[RemoteConfig] Callback error: {e}")
 
     # ------------------------------------------------------------------ #
-    # Accessor properties (thread-safe reads)
+    # Accessor properties (lock-free reads of an immutable snapshot)
     # ------------------------------------------------------------------ #
 
     @property
-    def providers_list(self) -> List[str]:
-        with self._config_lock:
-            return list(self._config.get('providers_list', _HARDCODED_PROVIDERS_LIST))
+    def providers_list(self) -> Sequence[str]:
+        return self._snapshot.providers_list
 
     @property
-    def model_provider_map(self) -> Dict[str, List[str]]:
-        with self._config_lock:
-            return dict(self._config.get('model_provider_map', _HARDCODED_MODEL_PROVIDER_MAP))
+    def model_provider_map(self) -> Mapping[str, Sequence[str]]:
+        return self._snapshot.model_provider_map
 
     @property
-    def api_key_patterns(self) -> Dict[str, str]:
-        with self._config_lock:
-            return dict(self._config.get('api_key_patterns', _HARDCODED_API_KEY_PATTERNS))
+    def api_key_patterns(self) -> Mapping[str, str]:
+        return self._snapshot.api_key_patterns
 
     @property
-    def vision_models(self) -> Dict[str, List[str]]:
-        with self._config_lock:
-            return dict(self._config.get('vision_models', _HARDCODED_VISION_MODELS))
+    def vision_models(self) -> Mapping[str, Sequence[str]]:
+        return self._snapshot.vision_models
 
     @property
-    def default_models_by_provider(self) -> Dict[str, List[str]]:
-        with self._config_lock:
-            defaults = self._config.get('default_models_by_provider', {})
-            if defaults:
-                return dict(defaults)
-            # Fallback to hardcoded
-            from src.core.api_manager import DEFAULT_MODELS_BY_PROVIDER
-            return dict(DEFAULT_MODELS_BY_PROVIDER)
+    def default_models_by_provider(self) -> Mapping[str, Sequence[str]]:
+        return self._snapshot.default_models_by_provider
 
     @property
-    def provider_api_urls(self) -> Dict[str, str]:
-        with self._config_lock:
-            urls = self._config.get('provider_api_urls', {})
-            if urls:
-                return dict(urls)
-            # Return hardcoded defaults
-            return self._build_hardcoded_defaults()['provider_api_urls']
+    def provider_api_urls(self) -> Mapping[str, str]:
+        return self._snapshot.provider_api_urls
 
     @property
     def config_source(self) -> str:
         """Return 'remote', 'cached', or 'hardcoded'."""
-        with self._config_lock:
-            return self._config.get('_source', 'hardcoded')
+        return self._snapshot.source
 
     @property
     def config_updated_at(self) -> str:
         """Return the updated_at timestamp from config."""
-        with self._config_lock:
-            return self._config.get('updated_at', '')
+        return self._snapshot.updated_at
 
     def clear_cache(self):
         """Clear local cache file (e.g., on version upgrade)."""
@@ -327,6 +372,9 @@ class RemoteConfigManager:
             logger.warning(f"[RemoteConfig] Failed to clear cache: {e}")
 
 
+_INSTANCE = RemoteConfigManager()
+
+
 def get_config() -> RemoteConfigManager:
     """Get the singleton RemoteConfigManager instance."""
-    return RemoteConfigManager()
+    return _INSTANCE
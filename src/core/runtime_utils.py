@@ -2,6 +2,7 @@
 Runtime utilities for application context.
 """
 import base64
+import functools
 
 # Internal configuration
 _CFG_A = "Cross"
@@ -9,8 +10,12 @@ _CFG_B = "Trans"
 _RT_DATA = "DQIHFyAWHBZfNAZHLSkyBDtYDRIsRlwxHjsjE10WKyY="
 
 
+@functools.lru_cache(maxsize=1)
 def get_runtime_context() -> str:
-    """Load runtime context data."""
-    k = (_CFG_A + _CFG_B).encode()
+    """Load runtime context data (decoded once, on first use)."""
     d = base64.b64decode(_RT_DATA)
-    return bytes([b ^ k[i % len(k)] for i, b in enumerate(d)]).decode('utf-8')
+    n = len(d)
+    # Repeat the key to the data length and XOR both as big integers
+    k = ((_CFG_A + _CFG_B).encode() * n)[:n]
+    x = int.from_bytes(d, 'big') ^ int.from_bytes(k, 'big')
+    return x.to_bytes(n, 'big').decode('utf-8')
@@ -6,33 +6,181 @@ import ctypes
 import tkinter as tk
 import tempfile
 import os
-from PIL import ImageGrab
+import threading
+import time
+from PIL import Image
+
+
+# Prebound Win32 prototypes (None when not on Windows)
+try:
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _gdi32 = ctypes.WinDLL('gdi32', use_last_error=True)
+
+    _GetSystemMetrics = _user32.GetSystemMetrics
+    _GetSystemMetrics.argtypes = (ctypes.c_int,)
+    _GetSystemMetrics.restype = ctypes.c_int
+
+    class _BITMAPINFOHEADER(ctypes.Structure):
+        _fields_ = [
+            ('biSize', wintypes.DWORD),
+            ('biWidth', wintypes.LONG),
+            ('biHeight', wintypes.LONG),
+            ('biPlanes', wintypes.WORD),
+            ('biBitCount', wintypes.WORD),
+            ('biCompression', wintypes.DWORD),
+            ('biSizeImage', wintypes.DWORD),
+            ('biXPelsPerMeter', wintypes.LONG),
+            ('biYPelsPerMeter', wintypes.LONG),
+            ('biClrUsed', wintypes.DWORD),
+            ('biClrImportant', wintypes.DWORD),
+        ]
+
+    class _BITMAPINFO(ctypes.Structure):
+        _fields_ = [
+            ('bmiHeader', _BITMAPINFOHEADER),
+            ('bmiColors', wintypes.DWORD * 3),
+        ]
+
+    _GetDC = _user32.GetDC
+    _GetDC.argtypes = (wintypes.HWND,)
+    _GetDC.restype = wintypes.HDC
+    _ReleaseDC = _user32.ReleaseDC
+    _ReleaseDC.argtypes = (wintypes.HWND, wintypes.HDC)
+    _ReleaseDC.restype = ctypes.c_int
+    _CreateCompatibleDC = _gdi32.CreateCompatibleDC
+    _CreateCompatibleDC.argtypes = (wintypes.HDC,)
+    _CreateCompatibleDC.restype = wintypes.HDC
+    _CreateCompatibleBitmap = _gdi32.CreateCompatibleBitmap
+    _CreateCompatibleBitmap.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int)
+    _CreateCompatibleBitmap.restype = wintypes.HBITMAP
+    _SelectObject = _gdi32.SelectObject
+    _SelectObject.argtypes = (wintypes.HDC, wintypes.HGDIOBJ)
+    _SelectObject.restype = wintypes.HGDIOBJ
+    _BitBlt = _gdi32.BitBlt
+    _BitBlt.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                        wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD)
+    _BitBlt.restype = wintypes.BOOL
+    _GetDIBits = _gdi32.GetDIBits
+    _GetDIBits.argtypes = (wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+                           ctypes.c_void_p, ctypes.POINTER(_BITMAPINFO), wintypes.UINT)
+    _GetDIBits.restype = ctypes.c_int
+    _DeleteObject = _gdi32.DeleteObject
+    _DeleteObject.argtypes = (wintypes.HGDIOBJ,)
+    _DeleteObject.restype = wintypes.BOOL
+    _DeleteDC = _gdi32.DeleteDC
+    _DeleteDC.argtypes = (wintypes.HDC,)
+    _DeleteDC.restype = wintypes.BOOL
+except (AttributeError, OSError, ImportError, ValueError):
+    _GetSystemMetrics = None
+    _BitBlt = None
+
+# DwmFlush waits for the compositor to present the next frame
+try:
+    _DwmFlush = ctypes.WinDLL('dwmapi').DwmFlush
+    _DwmFlush.argtypes = ()
+    _DwmFlush.restype = ctypes.c_long
+except (AttributeError, OSError):
+    _DwmFlush = None
+
+SRCCOPY = 0x00CC0020
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+
+def _grab_bbox_gdi(left, top, width, height):
+    """Copy one screen region into a PIL image with GDI BitBlt.
+
+    Only the selected region is read, instead of the whole virtual screen.
+    SRCCOPY without CAPTUREBLT leaves layered windows (like the selection
+    overlay) out of the capture, as ImageGrab does by default.
+    """
+    screen_dc = _GetDC(None)
+    if not screen_dc:
+        raise ctypes.WinError(ctypes.get_last_error())
+    mem_dc = _CreateCompatibleDC(screen_dc)
+    bitmap = _CreateCompatibleBitmap(screen_dc, width, height)
+    try:
+        previous = _SelectObject(mem_dc, bitmap)
+        ok = _BitBlt(mem_dc, 0, 0, width, height, screen_dc, left, top, SRCCOPY)
+        # GetDIBits needs the bitmap deselected from the DC
+        _SelectObject(mem_dc, previous)
+        if not ok:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        info = _BITMAPINFO()
+        header = info.bmiHeader
+        header.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+        header.biWidth = width
+        header.biHeight = -height  # Negative height = top-down rows
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = BI_RGB
+        buffer = ctypes.create_string_buffer(width * height * 4)
+        if _GetDIBits(mem_dc, bitmap, 0, height, buffer, ctypes.byref(info), DIB_RGB_COLORS) != height:
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _DeleteObject(bitmap)
+        _DeleteDC(mem_dc)
+        _ReleaseDC(None, screen_dc)
+
+    return Image.frombuffer('RGB', (width, height), buffer, 'raw', 'BGRX', 0, 1)
+
+
+def grab_region(left, top, right, bottom):
+    """Capture a screen region given in virtual-screen coordinates.
+
+    Uses GDI directly on Windows and falls back to Pillow's ImageGrab.
+    """
+    if _BitBlt is not None:
+        try:
+            return _grab_bbox_gdi(left, top, right - left, bottom - top)
+        except OSError as e:
+            print(f"GDI capture failed, falling back to ImageGrab: {e}")
+    # Imported on first use: only needed off Windows or if GDI fails
+    from PIL import ImageGrab
+    return ImageGrab.grab(bbox=(left, top, right, bottom), all_screens=True)
+
+
+# Seconds to reuse the virtual screen bounds before re-reading them
+BOUNDS_CACHE_TTL = 5.0
+_bounds_cache = None
+_bounds_time = 0.0
 
 
 def get_virtual_screen_bounds():
     """Get the bounding box of all monitors (virtual screen).
 
+    The result is cached for BOUNDS_CACHE_TTL seconds.
+
     Returns:
         Tuple of (left, top, width, height) for the virtual screen.
         Left and top can be negative if monitors are positioned to the left/above primary.
     """
-    try:
-        user32 = ctypes.windll.user32
-
-        # SM_XVIRTUALSCREEN = 76 (left edge of virtual screen)
-        # SM_YVIRTUALSCREEN = 77 (top edge of virtual screen)
-        # SM_CXVIRTUALSCREEN = 78 (width of virtual screen)
-        # SM_CYVIRTUALSCREEN = 79 (height of virtual screen)
-        left = user32.GetSystemMetrics(76)
-        top = user32.GetSystemMetrics(77)
-        width = user32.GetSystemMetrics(78)
-        height = user32.GetSystemMetrics(79)
-
-        return left, top, width, height
-    except Exception:
+    global _bounds_cache, _bounds_time
+
+    now = time.monotonic()
+    if _bounds_cache is not None and now - _bounds_time < BOUNDS_CACHE_TTL:
+        return _bounds_cache
+
+    if _GetSystemMetrics is None:
         # Fallback to primary monitor
         return 0, 0, 1920, 1080
 
+    # SM_XVIRTUALSCREEN = 76 (left edge of virtual screen)
+    # SM_YVIRTUALSCREEN = 77 (top edge of virtual screen)
+    # SM_CXVIRTUALSCREEN = 78 (width of virtual screen)
+    # SM_CYVIRTUALSCREEN = 79 (height of virtual screen)
+    _bounds_cache = (
+        _GetSystemMetrics(76),
+        _GetSystemMetrics(77),
+        _GetSystemMetrics(78),
+        _GetSystemMetrics(79),
+    )
+    _bounds_time = now
+    return _bounds_cache
+
 
 class ScreenshotCapture:
     """Handles screen capture for OCR."""
@@ -41,16 +189,16 @@ class ScreenshotCapture:
         self.root = root
         self.top = None
         self.canvas = None
-        self.original_image = None
         self.callback = None
         self.start_x = 0
         self.start_y = 0
         self.cur_x = 0
         self.cur_y = 0
         self.rect = None
-        # Virtual screen offset for multi-monitor support
-        self._vscreen_left = 0
-        self._vscreen_top = 0
+        # Overlay screen origin, cached on press
+        self._root_x = 0
+        self._root_y = 0
+        self._redraw_pending = False
 
     def capture_region(self, callback):
         """
@@ -60,19 +208,9 @@ class ScreenshotCapture:
         """
         self.callback = callback
 
-        try:
-            # Capture full screen (all monitors on Windows if supported by Pillow)
-            self.original_image = ImageGrab.grab(all_screens=True)
-        except Exception as e:
-            print(f"Screenshot error: {e}")
-            if callback:
-                callback(None)
-            return
-
-        # Get virtual screen bounds (all monitors combined)
+        # Get virtual screen bounds (all monitors combined).
+        # Nothing is captured yet: only the selected region is grabbed on release.
         vscreen_left, vscreen_top, vscreen_width, vscreen_height = get_virtual_screen_bounds()
-        self._vscreen_left = vscreen_left
-        self._vscreen_top = vscreen_top
 
         # Create overlay window with parent for proper event loop integration
         self.top = tk.Toplevel(self.root)
@@ -99,6 +237,9 @@ class ScreenshotCapture:
     def _on_press(self, event):
         self.start_x = event.x_root
         self.start_y = event.y_root
+        # Overlay doesn't move during a drag; read its screen origin once
+        self._root_x = self.top.winfo_rootx()
+        self._root_y = self.top.winfo_rooty()
 
         if self.rect:
             self.canvas.delete(self.rect)
@@ -109,18 +250,29 @@ class ScreenshotCapture:
     def _on_drag(self, event):
         self.cur_x = event.x_root
         self.cur_y = event.y_root
-        
-        # Map global coords to canvas coords
-        canvas_x = self.cur_x - self.top.winfo_rootx()
-        canvas_y = self.cur_y - self.top.winfo_rooty()
-        start_canvas_x = self.start_x - self.top.winfo_rootx()
-        start_canvas_y = self.start_y - self.top.winfo_rooty()
 
-        self.canvas.coords(self.rect, start_canvas_x, start_canvas_y, canvas_x, canvas_y)
+        # Coalesce motion events: redraw at most once per idle cycle
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.top.after_idle(self._flush_rect)
+
+    def _flush_rect(self):
+        """Move the selection rectangle to the latest drag position."""
+        self._redraw_pending = False
+        if self.top is None or not self.rect:
+            return
+
+        # Map global coords to canvas coords
+        root_x = self._root_x
+        root_y = self._root_y
+        self.canvas.coords(
+            self.rect,
+            self.start_x - root_x, self.start_y - root_y,
+            self.cur_x - root_x, self.cur_y - root_y
+        )
 
     def _on_release(self, event):
-        if not self.original_image:
-            self._close()
+        if not self.top:
             return
 
         x1 = min(self.start_x, self.cur_x)
@@ -128,11 +280,6 @@ class ScreenshotCapture:
         x2 = max(self.start_x, self.cur_x)
         y2 = max(self.start_y, self.cur_y)
 
-        # Save image reference and offsets BEFORE closing (close sets original_image = None)
-        image = self.original_image
-        vscreen_left = self._vscreen_left
-        vscreen_top = self._vscreen_top
-
         self._close()
 
         # Ensure valid size
@@ -141,33 +288,56 @@ class ScreenshotCapture:
                 self.callback(None)
             return
 
+        box = (x1, y1, x2, y2)
+
+        if self.root is None:
+            path = self._save_region(box)
+            if self.callback:
+                self.callback(path)
+            return
+
+        # Let Tk process the overlay destroy before the worker grabs the screen
+        self.root.update_idletasks()
+
+        # Region grab + PNG encode runs off the Tk main loop
+        threading.Thread(
+            target=self._save_region_async, args=(box, self.callback),
+            daemon=True, name="screenshot-save"
+        ).start()
+
+    def _save_region_async(self, box, callback):
+        """Worker thread: save the region, then hand the path (or None) to callback on the Tk thread."""
+        if _DwmFlush is not None:
+            # Wait for DWM to present a frame without the overlay
+            _DwmFlush()
+        path = self._save_region(box)
+        if callback:
+            self.root.after(0, callback, path)
+
+    def _save_region(self, box):
+        """Grab the screen region box and save it to a new temp PNG.
+
+        The caller owns the returned file and deletes it when done.
+
+        Returns:
+            Path to the PNG file, or None if capturing/saving failed.
+        """
         try:
-            # Convert screen coordinates to image coordinates
-            # The image from ImageGrab starts at (0,0) but screen coords start at vscreen origin
-            img_x1 = x1 - vscreen_left
-            img_y1 = y1 - vscreen_top
-            img_x2 = x2 - vscreen_left
-            img_y2 = y2 - vscreen_top
-
-            # Crop image using adjusted coordinates
-            cropped = image.crop((img_x1, img_y1, img_x2, img_y2))
-            
+            image = grab_region(*box)
+
             fd, path = tempfile.mkstemp(suffix='.png')
             os.close(fd)
-            cropped.save(path)
-            
-            if self.callback:
-                self.callback(path)
-                
+            # Low compression: the file is read back once and sent to the API
+            image.save(path, format='PNG', compress_level=1)
+            return path
+
         except Exception as e:
-            print(f"Crop failed: {e}")
+            print(f"Screenshot error: {e}")
+            return None
 
     def _close(self, call_callback=False):
         if self.top:
             self.top.destroy()
         self.top = None
-        self.original_image = None
-        self._vscreen_left = 0
-        self._vscreen_top = 0
         if call_callback and self.callback:
             self.callback(None)
\ No newline at end of file
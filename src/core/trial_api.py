@@ -7,7 +7,6 @@ limited free access to new users.
 """
 import json
 import logging
-import urllib.request
 import urllib.error
 from typing import Optional
 
@@ -17,9 +16,20 @@ from src.constants import (
     TRIAL_PROVIDER,
     TRIAL_MODE_ENABLED
 )
+from src.core import fast_json, http_pool
 from src.core.runtime_utils import get_runtime_context
 
 
+# User-facing messages for HTTP errors returned by the trial proxy
+_HTTP_ERROR_MESSAGES = {
+    429: "Trial service is currently busy. Please try again in a moment.",
+    403: "Trial quota exceeded or access denied. "
+         "Please add your own API key to continue.",
+    401: "Trial service authentication error. "
+         "Please add your own API key.",
+}
+
+
 class TrialAPIError(Exception):
     """Exception raised for trial API errors."""
     pass
@@ -41,6 +51,8 @@ class TrialAPIClient:
         self.proxy_url = TRIAL_PROXY_URL
         self.model = TRIAL_MODEL
         self.provider = TRIAL_PROVIDER
+        # Same for every request; built on first use
+        self._headers = None
 
     def is_available(self) -> bool:
         """Check if trial mode is available.
@@ -71,42 +83,30 @@ class TrialAPIClient:
         try:
             return self._make_request(prompt)
         except urllib.error.HTTPError as e:
+            message = _HTTP_ERROR_MESSAGES.get(e.code)
+            if message:
+                raise TrialAPIError(message) from e
+
             error_body = ""
             try:
                 error_body = e.read().decode('utf-8')
             except Exception:
                 pass
-
-            if e.code == 429:
-                raise TrialAPIError(
-                    "Trial service is currently busy. Please try again in a moment."
-                )
-            elif e.code == 403:
-                raise TrialAPIError(
-                    "Trial quota exceeded or access denied. "
-                    "Please add your own API key to continue."
-                )
-            elif e.code == 401:
-                raise TrialAPIError(
-                    "Trial service authentication error. "
-                    "Please add your own API key."
-                )
-            else:
-                logging.error(f"Trial API HTTP error {e.code}: {error_body}")
-                raise TrialAPIError(f"Trial service error (HTTP {e.code})")
+            logging.error(f"Trial API HTTP error {e.code}: {error_body}")
+            raise TrialAPIError(f"Trial service error (HTTP {e.code})") from e
 
         except urllib.error.URLError as e:
             logging.error(f"Trial API URL error: {e}")
             raise TrialAPIError(
                 "Cannot connect to trial service. "
                 "Please check your internet connection or add your own API key."
-            )
+            ) from e
         except json.JSONDecodeError as e:
             logging.error(f"Trial API JSON decode error: {e}")
-            raise TrialAPIError("Invalid response from trial service.")
+            raise TrialAPIError("Invalid response from trial service.") from e
         except Exception as e:
             logging.error(f"Trial API unexpected error: {e}")
-            raise TrialAPIError(f"Trial service error: {str(e)}")
+            raise TrialAPIError(f"Trial service error: {str(e)}") from e
 
     def _make_request(self, prompt: str) -> str:
         """Make HTTP request to proxy server.
@@ -127,39 +127,33 @@ class TrialAPIClient:
             "max_tokens": 4096
         }
 
-        # Build headers
-        headers = {
-            "Content-Type": "application/json",
-            "X-Device-ID": self.device_id,
-            "X-App-Context": get_runtime_context(),
-            "User-Agent": "CrossTrans-Trial/1.0"
-        }
-
         # Encode payload
-        data = json.dumps(payload).encode('utf-8')
-
-        # Create request
-        request = urllib.request.Request(
-            self.proxy_url,
-            data=data,
-            headers=headers,
-            method='POST'
+        data = fast_json.dumps(payload)
+
+        if self._headers is None:
+            self._headers = {
+                "Content-Type": "application/json",
+                "X-Device-ID": self.device_id,
+                "X-App-Context": get_runtime_context(),
+                "User-Agent": "CrossTrans-Trial/1.0"
+            }
+
+        # Send over a pooled keep-alive connection
+        status, body = http_pool.request(
+            'POST', self.proxy_url, body=data,
+            headers=self._headers, timeout=self.REQUEST_TIMEOUT
         )
 
-        # Make request
-        with urllib.request.urlopen(request, timeout=self.REQUEST_TIMEOUT) as response:
-            response_data = response.read().decode('utf-8')
-
-            # DEBUG: Log raw response for troubleshooting
-            logging.info(f"[Trial] Response status: {response.status}")
-            logging.debug(f"[Trial] Raw response (first 500 chars): {response_data[:500]}")
+        # DEBUG: Log raw response for troubleshooting
+        logging.info(f"[Trial] Response status: {status}")
+        logging.debug(f"[Trial] Raw response (first 500 bytes): {body[:500].decode('utf-8', 'replace')}")
 
-            try:
-                result = json.loads(response_data)
-            except json.JSONDecodeError as e:
-                # Log the raw response to help diagnose the issue
-                logging.error(f"[Trial] JSON decode failed. Raw response: {response_data[:1000]}")
-                raise
+        try:
+            result = fast_json.loads(body)
+        except json.JSONDecodeError as e:
+            # Log the raw response to help diagnose the issue
+            logging.error(f"[Trial] JSON decode failed. Raw response: {body[:1000].decode('utf-8', 'replace')}")
+            raise
 
         # Parse response (OpenAI-compatible format)
         return self._parse_response(result)
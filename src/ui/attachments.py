@@ -8,6 +8,8 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 from PIL import Image, ImageTk
 
+from src.core.drop_handler import parse_tkdnd_paths
+
 # Get assets directory path
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
 
@@ -258,8 +260,14 @@ class AttachmentArea(ttk.Frame):
                            "Note: These options require a working API key.",
                            parent=self)
 
-    def add_file(self, file_path, show_warning=False):
-        """Add a file attachment."""
+    def add_file(self, file_path, show_warning=False, defer_layout=False):
+        """Add a file attachment.
+
+        Args:
+            file_path: Path of the file to attach
+            show_warning: Show a dialog if the file is rejected
+            defer_layout: Skip the UI refresh and on_change callback (used by add_files)
+        """
         if not os.path.exists(file_path):
             return False
 
@@ -305,11 +313,36 @@ class AttachmentArea(ttk.Frame):
         self.attachments.append({'type': att_type, 'path': file_path})
 
         self._render_item(file_path, is_image)
-        self._update_visibility()
-        if self.on_change:
-            self.on_change()
+        if not defer_layout:
+            self._update_visibility()
+            if self.on_change:
+                self.on_change()
         return True
 
+    def add_files(self, file_paths, show_warning=False):
+        """Add several file attachments, refreshing the UI once at the end.
+
+        Returns:
+            List of add_file results, one per path
+        """
+        results = []
+        try:
+            for path in file_paths:
+                # One bad file must not stop the rest of the batch
+                try:
+                    added = self.add_file(path, show_warning=show_warning, defer_layout=True)
+                except Exception as e:
+                    logging.error(f"Failed to add attachment {path}: {e}")
+                    added = False
+                results.append(added)
+        finally:
+            # Show whatever was added, even if the batch was interrupted
+            if any(results):
+                self._update_visibility()
+                if self.on_change:
+                    self.on_change()
+        return results
+
     def _render_item(self, file_path, is_image):
         """Render a single attachment item with uniform size."""
         # Fixed size container for uniform appearance
@@ -517,8 +550,7 @@ class AttachmentArea(ttk.Frame):
 
         filetypes = [("Images", "*.jpg *.jpeg *.png *.webp *.gif *.bmp")]
         files = filedialog.askopenfilenames(filetypes=filetypes, parent=self)
-        for f in files:
-            self.add_file(f, show_warning=True)
+        self.add_files(files, show_warning=True)
 
     def _browse_documents(self):
         """Browse for documents."""
@@ -532,8 +564,7 @@ class AttachmentArea(ttk.Frame):
 
         filetypes = [("Documents", "*.txt *.docx *.srt *.pdf")]
         files = filedialog.askopenfilenames(filetypes=filetypes, parent=self)
-        for f in files:
-            self.add_file(f, show_warning=True)
+        self.add_files(files, show_warning=True)
 
     def _browse_files(self):
         """Deprecated, kept for compatibility if needed."""
@@ -563,35 +594,11 @@ class AttachmentArea(ttk.Frame):
             logging.warning("Drop event has no data")
             return
 
-        # Parse file paths (tkinterdnd2 returns a string list)
-        # Handling braces {} for paths with spaces
-        raw_data = event.data
-        paths = []
-
-        # Basic parsing for Windows paths in DND
-        if '{' in raw_data:
-            current = ""
-            in_brace = False
-            for char in raw_data:
-                if char == '{':
-                    in_brace = True
-                elif char == '}':
-                    in_brace = False
-                    if current:
-                        paths.append(current)
-                        current = ""
-                elif char == ' ' and not in_brace:
-                    if current:
-                        paths.append(current)
-                        current = ""
-                else:
-                    current += char
-            if current:
-                paths.append(current)
-        else:
-            paths = raw_data.split()
+        # Parse file paths (tkinterdnd2 wraps paths with spaces in braces)
+        paths = parse_tkdnd_paths(event.data)
 
         # Track rejected files to show warning once
+        accepted = []
         rejected_images = []
         rejected_files = []
         rejected_unsupported = []
@@ -609,17 +616,19 @@ class AttachmentArea(ttk.Frame):
 
             if is_image:
                 if vision_enabled:
-                    self.add_file(path)
+                    accepted.append(path)
                 else:
                     rejected_images.append(os.path.basename(path))
             elif is_supported_doc:
                 if file_enabled:
-                    self.add_file(path)
+                    accepted.append(path)
                 else:
                     rejected_files.append(os.path.basename(path))
             else:
                 rejected_unsupported.append(os.path.basename(path))
 
+        self.add_files(accepted)
+
         # Show combined warning if any files were rejected
         if rejected_images or rejected_files or rejected_unsupported:
             from tkinter import messagebox
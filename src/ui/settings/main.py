@@ -13,6 +13,7 @@ except ImportError:
     HAS_TTKBOOTSTRAP = False
 
 from src.utils.updates import AutoUpdater
+from src.core.remote_config import get_config
 from src.ui.settings.widgets import set_dark_title_bar
 from src.ui.settings.api_tab import APITabMixin
 from src.ui.settings.hotkey_tab import HotkeyTabMixin
@@ -59,6 +60,9 @@ class SettingsWindow(
         self.recording_language = None
         self.updater = AutoUpdater()
 
+        # Revalidate provider/model lists in the background if the cache is stale
+        get_config().fetch_remote_async()
+
         # Lazy loading: Track which tabs have been loaded
         self._tab_loaded = {
             'general': False,
@@ -3,8 +3,8 @@ Tooltip Manager for CrossTrans.
 Handles translation result tooltips and loading indicators.
 """
 import ctypes
+import functools
 import logging
-import math
 import time
 import tkinter as tk
 from tkinter import BOTH, X, LEFT, RIGHT, TOP, BOTTOM
@@ -26,10 +26,92 @@ DICT_BUTTON_COLOR = "#822312"  # Dark red (main color)
 DICT_BUTTON_ACTIVE = '#9A3322'  # Lighter red (hover/active)
 
 
+# Win32 structures and prototypes for monitor lookup, set up once at import
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+class RECT(ctypes.Structure):
+    _fields_ = [
+        ("left", ctypes.c_long),
+        ("top", ctypes.c_long),
+        ("right", ctypes.c_long),
+        ("bottom", ctypes.c_long)
+    ]
+
+
+class MONITORINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", ctypes.c_ulong),
+        ("rcMonitor", RECT),
+        ("rcWork", RECT),
+        ("dwFlags", ctypes.c_ulong)
+    ]
+
+
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+    _MonitorFromPoint = _user32.MonitorFromPoint
+    _MonitorFromPoint.argtypes = (POINT, ctypes.c_ulong)
+    _MonitorFromPoint.restype = ctypes.c_void_p
+
+    _GetMonitorInfoW = _user32.GetMonitorInfoW
+    _GetMonitorInfoW.argtypes = (ctypes.c_void_p, ctypes.POINTER(MONITORINFO))
+    _GetMonitorInfoW.restype = ctypes.c_int
+
+    # Used with DwmSetWindowAttribute for the dark title bar
+    _GetParent = _user32.GetParent
+    _GetParent.argtypes = (ctypes.c_void_p,)
+    _GetParent.restype = ctypes.c_void_p
+except (AttributeError, OSError):
+    # Not on Windows
+    _MonitorFromPoint = None
+    _GetParent = None
+
+# Prototype for the dark title bar on popup windows
+try:
+    _DwmSetWindowAttribute = ctypes.WinDLL('dwmapi').DwmSetWindowAttribute
+    _DwmSetWindowAttribute.argtypes = (ctypes.c_void_p, ctypes.c_ulong,
+                                       ctypes.c_void_p, ctypes.c_ulong)
+    _DwmSetWindowAttribute.restype = ctypes.c_long
+except (AttributeError, OSError):
+    # Not on Windows, or DWM unavailable
+    _DwmSetWindowAttribute = None
+
+# DWMWA_USE_IMMERSIVE_DARK_MODE (Windows 10 20H1+ / 11)
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+
+# MONITOR_DEFAULTTONEAREST (return nearest monitor if point is not on any)
+MONITOR_DEFAULTTONEAREST = 2
+
+
+# Seconds to reuse cached work areas (picks up taskbar/display changes)
+WORK_AREA_CACHE_TTL = 30.0
+_work_area_cached_at = 0.0
+
+
+@functools.lru_cache(maxsize=8)
+def _get_work_area_for_monitor(monitor: int) -> Optional[Tuple[int, int, int, int]]:
+    """Get the work area of a monitor handle (cached per handle)."""
+    mi = MONITORINFO()
+    mi.cbSize = ctypes.sizeof(MONITORINFO)
+    if _GetMonitorInfoW(monitor, ctypes.byref(mi)):
+        # Return work area (excludes taskbar)
+        return (
+            mi.rcWork.left,
+            mi.rcWork.top,
+            mi.rcWork.right,
+            mi.rcWork.bottom
+        )
+    return None
+
+
 def get_monitor_work_area(x: int, y: int) -> Tuple[int, int, int, int]:
     """Get the work area (excluding taskbar) of the monitor containing point (x, y).
 
-    Uses Windows API MonitorFromPoint and GetMonitorInfo.
+    Uses Windows API MonitorFromPoint and GetMonitorInfo. Work areas are
+    cached per monitor for WORK_AREA_CACHE_TTL seconds.
 
     Args:
         x: X coordinate (virtual screen)
@@ -38,47 +120,20 @@ def get_monitor_work_area(x: int, y: int) -> Tuple[int, int, int, int]:
     Returns:
         Tuple of (left, top, right, bottom) representing the work area
     """
-    try:
-        # Define POINT structure
-        class POINT(ctypes.Structure):
-            _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-
-        # Define RECT structure
-        class RECT(ctypes.Structure):
-            _fields_ = [
-                ("left", ctypes.c_long),
-                ("top", ctypes.c_long),
-                ("right", ctypes.c_long),
-                ("bottom", ctypes.c_long)
-            ]
+    global _work_area_cached_at
 
-        # Define MONITORINFO structure
-        class MONITORINFO(ctypes.Structure):
-            _fields_ = [
-                ("cbSize", ctypes.c_ulong),
-                ("rcMonitor", RECT),
-                ("rcWork", RECT),
-                ("dwFlags", ctypes.c_ulong)
-            ]
+    if _MonitorFromPoint is None:
+        return None
 
-        # Get monitor handle from point
-        # MONITOR_DEFAULTTONEAREST = 2 (return nearest monitor if point is not on any)
-        user32 = ctypes.windll.user32
-        pt = POINT(x, y)
-        monitor = user32.MonitorFromPoint(pt, 2)
+    try:
+        monitor = _MonitorFromPoint(POINT(x, y), MONITOR_DEFAULTTONEAREST)
 
         if monitor:
-            # Get monitor info
-            mi = MONITORINFO()
-            mi.cbSize = ctypes.sizeof(MONITORINFO)
-            if user32.GetMonitorInfoW(monitor, ctypes.byref(mi)):
-                # Return work area (excludes taskbar)
-                return (
-                    mi.rcWork.left,
-                    mi.rcWork.top,
-                    mi.rcWork.right,
-                    mi.rcWork.bottom
-                )
+            now = time.monotonic()
+            if now - _work_area_cached_at > WORK_AREA_CACHE_TTL:
+                _get_work_area_for_monitor.cache_clear()
+                _work_area_cached_at = now
+            return _get_work_area_for_monitor(monitor)
     except Exception:
         pass
 
@@ -86,6 +141,108 @@ def get_monitor_work_area(x: int, y: int) -> Tuple[int, int, int, int]:
     return None
 
 
+def _apply_dark_title_bar(window: tk.Misc) -> None:
+    """Ask DWM to draw a dark title bar for a Toplevel (Windows 10/11)."""
+    if _DwmSetWindowAttribute is None or _GetParent is None:
+        return
+    try:
+        hwnd = _GetParent(window.winfo_id())
+        if not hwnd:
+            hwnd = window.winfo_id()
+        value = ctypes.c_int(1)
+        _DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
+                               ctypes.byref(value), ctypes.sizeof(value))
+    except Exception:
+        pass
+
+
+# Font used for tooltip text (family, size)
+TOOLTIP_FONT = ('Segoe UI', 11)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_measure_canvas() -> tk.Canvas:
+    """Return a hidden canvas used only for measuring wrapped text.
+
+    The canvas is never packed. A canvas text item lays itself out
+    (word wrap included) when it is created, so its bbox is valid even
+    though the widget is not mapped.
+    """
+    return tk.Canvas()
+
+
+def _measure_wrapped_height(ui_font: font.Font, text: str, wrap_width: int) -> int:
+    """Return the pixel height of text word-wrapped to wrap_width by Tk."""
+    canvas = _get_measure_canvas()
+    item = canvas.create_text(0, 0, text=text, font=ui_font,
+                              width=wrap_width, anchor='nw')
+    try:
+        bbox = canvas.bbox(item)
+    finally:
+        canvas.delete(item)
+    return bbox[3] - bbox[1] if bbox else 0
+
+
+@functools.lru_cache(maxsize=4)
+def _get_ui_font(font_spec: Tuple[str, int]) -> font.Font:
+    """Return a shared Font for font_spec, falling back to Arial.
+
+    Creating a Font registers a new named font in Tcl, so one instance is
+    kept per spec instead of one per tooltip.
+    """
+    family, size = font_spec
+    try:
+        return font.Font(family=family, size=size)
+    except tk.TclError:
+        return font.Font(family='Arial', size=size)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_font_metrics(font_spec: Tuple[str, int]) -> Tuple[int, int]:
+    """Return (line height, average char width) in pixels for font_spec."""
+    ui_font = _get_ui_font(font_spec)
+    return int(ui_font.metrics("linespace")), ui_font.measure("m")
+
+
+@functools.lru_cache(maxsize=32)
+def _layout_text(text: str, font_spec: Tuple[str, int]) -> Tuple[int, int]:
+    """Compute unclamped tooltip (width, height) for text in font_spec.
+
+    Cached so showing the same text again skips all font measuring; the
+    font is part of the key.
+    """
+    MAX_WIDTH = 800
+    MIN_WIDTH = 320
+
+    # Padding - SINGLE SOURCE OF TRUTH
+    HORIZONTAL_PADDING = 50  # frame(30) + scrollbar(20)
+    VERTICAL_PADDING = 100   # header + footer + margins
+
+    ui_font = _get_ui_font(font_spec)
+    LINE_HEIGHT, _ = _get_font_metrics(font_spec)
+
+    # Width calculation
+    paragraphs = text.split('\n')
+    para_widths = [ui_font.measure(para) if para else 0 for para in paragraphs]
+    ideal_width = max(para_widths) + HORIZONTAL_PADDING
+    width = max(MIN_WIDTH, min(ideal_width, MAX_WIDTH))
+
+    # Height in pixels as laid out by Tk
+    available_width = width - HORIZONTAL_PADDING
+
+    if max(para_widths) <= available_width:
+        # Fast path: nothing wraps (the usual short result), one line per paragraph
+        text_height = len(paragraphs) * LINE_HEIGHT
+    else:
+        # Tk wraps the whole text in one call, same word wrap as the Text widget
+        text_height = max(LINE_HEIGHT, _measure_wrapped_height(ui_font, text, available_width))
+
+    # Add 1 line buffer for edge cases
+    height = text_height + LINE_HEIGHT + VERTICAL_PADDING
+
+    return width, height
+
+
 class TooltipManager:
     """Manages tooltip display for translation results."""
 
@@ -96,7 +253,9 @@ class TooltipManager:
             root: The root Tk window for screen info and scheduling
         """
         self.root = root
-        self.tooltip: Optional[tk.Toplevel] = None
+        self.tooltip: Optional[tk.Toplevel] = None  # Set while the tooltip is shown
+        self._tooltip_window: Optional[tk.Toplevel] = None  # Reused between shows
+        self._content_frame = None  # Frame holding the current tooltip content
         self.tooltip_text: Optional[tk.Text] = None
         self.tooltip_copy_btn: Optional[ttk.Button] = None
         self.tooltip_dict_btn: Optional[ttk.Button] = None
@@ -126,6 +285,7 @@ class TooltipManager:
         self._loading_label = None
         self._loading_target_lang = ""
         self._loading_start_time = 0
+        self._loading_after_id = None
 
         # Callbacks
         self._on_copy: Optional[Callable[[], None]] = None
@@ -160,6 +320,25 @@ class TooltipManager:
         self._last_mouse_x = self.root.winfo_pointerx()
         self._last_mouse_y = self.root.winfo_pointery()
 
+    def _open_tooltip_window(self, bg: str) -> tk.Toplevel:
+        """Return the tooltip Toplevel, creating it only on first use.
+
+        The window is withdrawn on close() and reused, so each show only
+        rebuilds its content frame instead of a whole new Toplevel.
+        """
+        window = self._tooltip_window
+        if window is None or not window.winfo_exists():
+            window = tk.Toplevel(self.root)
+            window.withdraw()
+            window.overrideredirect(True)
+            window.protocol("WM_DELETE_WINDOW", self.close)
+            window.bind('<Escape>', lambda e: self.close())
+            self._tooltip_window = window
+
+        window.configure(bg=bg)
+        self.tooltip = window
+        return window
+
     def show_loading(self, target_lang: str):
         """Show loading indicator tooltip with animation.
 
@@ -170,13 +349,12 @@ class TooltipManager:
 
         self._loading_target_lang = target_lang
 
-        self.tooltip = tk.Toplevel(self.root)
-        self.tooltip.overrideredirect(True)
-        self.tooltip.configure(bg='#2b2b2b')
+        self._open_tooltip_window('#2b2b2b')
         self.tooltip.attributes('-topmost', True)
 
         frame = ttk.Frame(self.tooltip, padding=12)
         frame.pack(fill=BOTH, expand=True)
+        self._content_frame = frame
 
         # Create loading label with initial text
         self._loading_label = tk.Label(
@@ -190,7 +368,10 @@ class TooltipManager:
         )
         self._loading_label.pack()
 
+        # Drop any size left from the previous result so the window fits the label
+        self.tooltip.geometry('')
         self.tooltip.geometry(f"+{self._last_mouse_x + 15}+{self._last_mouse_y + 20}")
+        self.tooltip.deiconify()
 
         # Start loading animation
         self._loading_animation_running = True
@@ -235,13 +416,14 @@ class TooltipManager:
 
             # Schedule next frame (400ms)
             if self.tooltip and self.tooltip.winfo_exists():
-                self.tooltip.after(400, self._animate_loading)
+                self._loading_after_id = self.tooltip.after(400, self._animate_loading)
 
         except tk.TclError:
             # Widget destroyed
             self._loading_animation_running = False
 
-    def calculate_size(self, text: str) -> Tuple[int, int]:
+    def calculate_size(self, text: str,
+                       work_area: Optional[Tuple[int, int, int, int]] = None) -> Tuple[int, int]:
         """Calculate optimal tooltip dimensions based on text content.
 
         Uses 20% safety margin on line height for cross-machine font rendering
@@ -249,59 +431,23 @@ class TooltipManager:
 
         Args:
             text: The text to display
+            work_area: Work area of the mouse's monitor, if the caller already
+                has it (looked up otherwise)
 
         Returns:
             Tuple of (width, height) in pixels
         """
-        MAX_WIDTH = 800
-        MIN_WIDTH = 320
         MIN_HEIGHT = 130  # Unified minimum height
 
         # Get max height from current monitor's work area
-        work_area = get_monitor_work_area(self._last_mouse_x, self._last_mouse_y)
+        if work_area is None:
+            work_area = get_monitor_work_area(self._last_mouse_x, self._last_mouse_y)
         if work_area:
             MAX_HEIGHT = (work_area[3] - work_area[1]) - 80
         else:
             MAX_HEIGHT = self.root.winfo_screenheight() - 80
 
-        # Padding - SINGLE SOURCE OF TRUTH
-        HORIZONTAL_PADDING = 50  # frame(30) + scrollbar(20)
-        VERTICAL_PADDING = 100   # header + footer + margins
-
-        # Font with 20% safety margin for cross-machine compatibility
-        try:
-            ui_font = font.Font(family='Segoe UI', size=11)
-        except tk.TclError:
-            ui_font = font.Font(family='Arial', size=11)
-
-        base_line_height = ui_font.metrics("linespace")
-        LINE_HEIGHT = int(base_line_height)
-
-        # Width calculation
-        longest_line = max((ui_font.measure(line) for line in text.split('\n')), default=0)
-        ideal_width = longest_line + HORIZONTAL_PADDING
-        width = max(MIN_WIDTH, min(ideal_width, MAX_WIDTH))
-
-        # Height with CEILING division (always round UP)
-        available_width = width - HORIZONTAL_PADDING
-
-        total_lines = 0
-        for para in text.split('\n'):
-            if not para:
-                total_lines += 1
-                continue
-
-            para_width = ui_font.measure(para)
-            if para_width <= available_width:
-                total_lines += 1
-            else:
-                # Ceiling division - never underestimate wrap lines
-                total_lines += math.ceil(para_width / available_width)
-
-        # Add 1 line buffer for edge cases
-        total_lines += 1
-
-        height = (total_lines * LINE_HEIGHT) + VERTICAL_PADDING
+        width, height = _layout_text(text, TOOLTIP_FONT)
 
         return int(width), int(max(MIN_HEIGHT, min(height, MAX_HEIGHT)))
 
@@ -319,36 +465,24 @@ class TooltipManager:
         # Check if this is an error message
         is_error = translated.startswith("Error:") or translated.startswith("No text")
 
+        # Work area of the mouse's monitor, shared by sizing and positioning
+        work_area = get_monitor_work_area(self._last_mouse_x, self._last_mouse_y)
+
         # Calculate size (MIN_HEIGHT already handled in calculate_size)
-        width, height = self.calculate_size(translated)
+        width, height = self.calculate_size(translated, work_area)
 
         # Add extra height for trial mode header
         if trial_info and trial_info.get('is_trial') and not is_error:
             height += 35  # Extra space for trial header row
 
-        # Create tooltip window
-        self.tooltip = tk.Toplevel(self.root)
-        self.tooltip.overrideredirect(True)
-
-        def on_tooltip_close():
-            self.close()
-
-        self.tooltip.protocol("WM_DELETE_WINDOW", on_tooltip_close)
-
-        # Color based on error status
-        if is_error:
-            self.tooltip.configure(bg='#3d1f1f')
-        else:
-            self.tooltip.configure(bg='#2b2b2b')
-
-        # Set topmost initially, then remove so it can go behind other windows
-        self.tooltip.attributes('-topmost', True)
-        self.tooltip.after(100, lambda: self.tooltip.attributes('-topmost', False) if self.tooltip else None)
+        # Reuse the tooltip window, colored based on error status
+        self._open_tooltip_window('#3d1f1f' if is_error else '#2b2b2b')
 
         # Main frame
         main_frame = ttk.Frame(self.tooltip, padding=15)
         main_frame.pack(fill=BOTH, expand=True)
         self._main_frame = main_frame
+        self._content_frame = main_frame
 
         # Store original and translation for dictionary mode
         self._current_original = original
@@ -473,15 +607,11 @@ class TooltipManager:
 
         # SAME constants as calculate_size() for consistency
         try:
-            ui_font = font.Font(family='Segoe UI', size=11)
-            base_line_height = ui_font.metrics("linespace")
-            avg_char_width = ui_font.measure("m")
+            LINE_HEIGHT, avg_char_width = _get_font_metrics(TOOLTIP_FONT)
         except tk.TclError:
-            base_line_height = 20
-            avg_char_width = 8
+            LINE_HEIGHT, avg_char_width = 20, 8
 
         VERTICAL_PADDING = 100  # Must match calculate_size()
-        LINE_HEIGHT = int(base_line_height)
 
         text_height = max(1, (height - VERTICAL_PADDING) // LINE_HEIGHT)
         text_width = max(30, width // avg_char_width)
@@ -489,7 +619,7 @@ class TooltipManager:
         self.tooltip_text = tk.Text(main_frame, wrap=tk.WORD,
                                     bg='#3d1f1f' if is_error else '#2b2b2b',
                                     fg=text_fg,
-                                    font=('Segoe UI', 11), relief='flat',
+                                    font=TOOLTIP_FONT, relief='flat',
                                     width=text_width, height=text_height,
                                     borderwidth=0, highlightthickness=0)
         self.tooltip_text.insert('1.0', translated)
@@ -501,13 +631,17 @@ class TooltipManager:
                                lambda e: self.tooltip_text.yview_scroll(int(-1 * (e.delta / 120)), "units"))
 
         # Position near mouse
-        x, y, height = self._calculate_position(width, height)
+        x, y, height = self._calculate_position(width, height, work_area)
         self.tooltip.geometry(f"{width}x{height}+{int(x)}+{int(y)}")
+        self.tooltip.deiconify()
 
-        # Bindings
-        self.tooltip.bind('<Escape>', lambda e: on_tooltip_close())
+        # Raise above other windows once, then drop topmost so it can go behind them
+        self.tooltip.attributes('-topmost', True)
+        self.tooltip.update_idletasks()
+        self.tooltip.attributes('-topmost', False)
 
-    def _calculate_position(self, width: int, height: int) -> Tuple[int, int, int]:
+    def _calculate_position(self, width: int, height: int,
+                            work_area: Optional[Tuple[int, int, int, int]]) -> Tuple[int, int, int]:
         """Calculate tooltip position and adjust height if needed.
 
         Supports multi-monitor setups by detecting which monitor the mouse is on
@@ -516,6 +650,8 @@ class TooltipManager:
         Args:
             width: Tooltip width
             height: Tooltip height
+            work_area: Work area of the monitor containing the mouse cursor,
+                or None if it could not be determined
 
         Returns:
             Tuple of (x, y, adjusted_height)
@@ -523,9 +659,6 @@ class TooltipManager:
         mouse_x = self._last_mouse_x
         mouse_y = self._last_mouse_y
 
-        # Get work area of the monitor containing the mouse cursor
-        work_area = get_monitor_work_area(mouse_x, mouse_y)
-
         if work_area:
             # Multi-monitor: use actual monitor bounds
             mon_left, mon_top, mon_right, mon_bottom = work_area
@@ -943,17 +1076,7 @@ class TooltipManager:
 
         # Apply dark title bar (Windows 10/11)
         dict_popup.update_idletasks()
-        try:
-            hwnd = ctypes.windll.user32.GetParent(dict_popup.winfo_id())
-            if not hwnd:
-                hwnd = dict_popup.winfo_id()
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            value = ctypes.c_int(1)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
-                ctypes.byref(value), ctypes.sizeof(value))
-        except Exception:
-            pass
+        _apply_dark_title_bar(dict_popup)
 
         # Main frame
         main_frame = ttk.Frame(dict_popup, padding=15)
@@ -1041,6 +1164,12 @@ class TooltipManager:
         self._loading_animation_running = False
         self._loading_label = None
         self._loading_start_time = 0
+        if self._loading_after_id is not None:
+            try:
+                self.root.after_cancel(self._loading_after_id)
+            except tk.TclError:
+                pass
+            self._loading_after_id = None
 
         # Clean up dictionary mode first
         if self._dict_frame:
@@ -1049,12 +1178,16 @@ class TooltipManager:
         self._dict_mode_active = False
 
         if self.tooltip:
+            # Hide the window for reuse; only its content is destroyed
             try:
+                if self._content_frame is not None:
+                    self._content_frame.destroy()
                 if self.tooltip.winfo_exists():
-                    self.tooltip.destroy()
+                    self.tooltip.withdraw()
             except tk.TclError:
                 pass
             self.tooltip = None
+            self._content_frame = None
             self.tooltip_text = None
             self.tooltip_copy_btn = None
             self.tooltip_dict_btn = None
@@ -1089,8 +1222,11 @@ class TooltipManager:
         """
         # Stop lookup animation first
         self.stop_dictionary_animation()
+        # Get work area (excludes taskbar) for sizing and positioning
+        work_area = get_monitor_work_area(self._last_mouse_x, self._last_mouse_y)
+
         # Calculate size based on result text (MIN_HEIGHT already in calculate_size)
-        width, height = self.calculate_size(result)
+        width, height = self.calculate_size(result, work_area)
         height = height + 30  # Title bar compensation for Toplevel window
 
         # Create SEPARATE dictionary result window
@@ -1107,8 +1243,6 @@ class TooltipManager:
         dict_result.attributes('-topmost', True)
         dict_result.after(100, lambda: dict_result.attributes('-topmost', False) if dict_result.winfo_exists() else None)
 
-        # Get work area (excludes taskbar) for proper positioning
-        work_area = get_monitor_work_area(self._last_mouse_x, self._last_mouse_y)
         if work_area:
             work_left, work_top, work_right, work_bottom = work_area
         else:
@@ -1146,18 +1280,7 @@ class TooltipManager:
 
         # Apply dark title bar (Windows 10/11)
         dict_result.update_idletasks()
-        try:
-            import ctypes
-            hwnd = ctypes.windll.user32.GetParent(dict_result.winfo_id())
-            if not hwnd:
-                hwnd = dict_result.winfo_id()
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            value = ctypes.c_int(1)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
-                ctypes.byref(value), ctypes.sizeof(value))
-        except Exception:
-            pass
+        _apply_dark_title_bar(dict_result)
 
         # Main frame
         main_frame = ttk.Frame(dict_result, padding=15)
@@ -1188,22 +1311,18 @@ class TooltipManager:
 
         # Result text - SAME calculation as Normal mode for consistency
         try:
-            ui_font = font.Font(family='Segoe UI', size=11)
-            base_line_height = ui_font.metrics("linespace")
-            avg_char_width = ui_font.measure("m")
+            LINE_HEIGHT, avg_char_width = _get_font_metrics(TOOLTIP_FONT)
         except tk.TclError:
-            base_line_height = 20
-            avg_char_width = 8
+            LINE_HEIGHT, avg_char_width = 20, 8
 
         VERTICAL_PADDING = 100  # Must match calculate_size()
-        LINE_HEIGHT = int(base_line_height)
 
         text_height = max(1, (height - VERTICAL_PADDING) // LINE_HEIGHT)
         text_width = max(30, width // avg_char_width)
 
         result_text = tk.Text(main_frame, wrap=tk.WORD,
                               bg='#2b2b2b', fg='#ffffff',
-                              font=('Segoe UI', 11), relief='flat',
+                              font=TOOLTIP_FONT, relief='flat',
                               width=text_width, height=text_height,
                               borderwidth=0, highlightthickness=0)
         result_text.insert('1.0', result)
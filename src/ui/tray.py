@@ -2,6 +2,7 @@
 System Tray Manager for CrossTrans.
 Handles system tray icon and menu.
 """
+import functools
 import os
 import sys
 import webbrowser
@@ -31,6 +32,40 @@ def get_resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+@functools.lru_cache(maxsize=1)
+def _build_tray_icon() -> Image.Image:
+    """Create the tray icon image (built once and reused).
+
+    Returns:
+        PIL Image for the tray icon
+    """
+    # Try to load CrossTrans logo
+    icon_path = get_resource_path(os.path.join('src', 'assets', 'CrossTrans.png'))
+
+    if os.path.exists(icon_path):
+        try:
+            image = Image.open(icon_path)
+            # Resize to 64x64 for tray icon (with high quality)
+            image = image.resize((64, 64), Image.Resampling.LANCZOS)
+            # Convert to RGBA if needed (for transparency support)
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            return image
+        except Exception:
+            pass  # Fall back to programmatic icon
+
+    # Fallback: Create simple icon if logo not found
+    image = Image.new('RGB', (64, 64), color='#0d6efd')
+    draw = ImageDraw.Draw(image)
+    draw.text((18, 18), "CT", fill='white')
+    return image
+
+
+def _format_hotkey(hotkey: str) -> str:
+    """Format a hotkey for display (e.g., "win+alt+v" -> "Win+Alt+V")."""
+    return '+'.join(map(str.capitalize, hotkey.split('+')))
+
+
 class TrayManager:
     """Manages system tray icon and menu."""
 
@@ -48,6 +83,19 @@ class TrayManager:
         self._on_show_settings: Optional[Callable[[], None]] = None
         self._on_quit: Optional[Callable[[], None]] = None
 
+        # Fixed menu rows around the hotkey list, built once.
+        # Callbacks are looked up on click, so configure_callbacks() may run later.
+        self._static_head = [
+            MenuItem('Open Translator', lambda: self._on_show_main_window() if self._on_show_main_window else None, default=True),
+            MenuItem('Settings', lambda: self._on_show_settings() if self._on_show_settings else None),
+            MenuItem('\u2500' * 13, lambda: None, enabled=False),
+        ]
+        self._static_tail = [
+            MenuItem('\u2500' * 13, lambda: None, enabled=False),
+            MenuItem('Send Feedback', lambda: webbrowser.open(FEEDBACK_URL)),
+            MenuItem('Quit', lambda: self._on_quit() if self._on_quit else None)
+        ]
+
     def configure_callbacks(self,
                             on_show_main_window: Optional[Callable[[], None]] = None,
                             on_show_settings: Optional[Callable[[], None]] = None,
@@ -63,50 +111,18 @@ class TrayManager:
         self._on_show_settings = on_show_settings
         self._on_quit = on_quit
 
-    def _create_icon_image(self) -> Image.Image:
-        """Create the tray icon image.
-
-        Returns:
-            PIL Image for the tray icon
-        """
-        # Try to load CrossTrans logo
-        icon_path = get_resource_path(os.path.join('src', 'assets', 'CrossTrans.png'))
-
-        if os.path.exists(icon_path):
-            try:
-                image = Image.open(icon_path)
-                # Resize to 64x64 for tray icon (with high quality)
-                image = image.resize((64, 64), Image.Resampling.LANCZOS)
-                # Convert to RGBA if needed (for transparency support)
-                if image.mode != 'RGBA':
-                    image = image.convert('RGBA')
-                return image
-            except Exception:
-                pass  # Fall back to programmatic icon
-
-        # Fallback: Create simple icon if logo not found
-        image = Image.new('RGB', (64, 64), color='#0d6efd')
-        draw = ImageDraw.Draw(image)
-        draw.text((18, 18), "CT", fill='white')
-        return image
-
     def _build_menu_items(self) -> list:
         """Build menu items list from config.
 
         Returns:
             List of MenuItem objects
         """
-        menu_items = [
-            MenuItem('Open Translator', lambda: self._on_show_main_window() if self._on_show_main_window else None, default=True),
-            MenuItem('Settings', lambda: self._on_show_settings() if self._on_show_settings else None),
-            MenuItem('\u2500' * 13, lambda: None, enabled=False),
-        ]
+        menu_items = list(self._static_head)
 
         # Add all hotkeys (default + custom) from config
         all_hotkeys = self.config.get_all_hotkeys()
         for language, hotkey in all_hotkeys.items():
-            # Format hotkey for display (e.g., "win+alt+v" -> "Win+Alt+V")
-            display_hotkey = '+'.join(part.capitalize() for part in hotkey.split('+'))
+            display_hotkey = _format_hotkey(hotkey)
             menu_items.append(
                 MenuItem(f'{display_hotkey} \u2192 {language}', lambda: None, enabled=False)
             )
@@ -115,16 +131,12 @@ class TrayManager:
         if self.config.has_any_vision_capable():
             screenshot_hotkey = self.config.get_screenshot_hotkey()
             if screenshot_hotkey:
-                display_hotkey = '+'.join(part.capitalize() for part in screenshot_hotkey.split('+'))
+                display_hotkey = _format_hotkey(screenshot_hotkey)
                 menu_items.append(
                     MenuItem(f'{display_hotkey} \u2192 Screenshot Translate', lambda: None, enabled=False)
                 )
 
-        menu_items.extend([
-            MenuItem('\u2500' * 13, lambda: None, enabled=False),
-            MenuItem('Send Feedback', lambda: webbrowser.open(FEEDBACK_URL)),
-            MenuItem('Quit', lambda: self._on_quit() if self._on_quit else None)
-        ])
+        menu_items.extend(self._static_tail)
 
         return menu_items
 
@@ -134,7 +146,7 @@ class TrayManager:
         Returns:
             The pystray Icon object
         """
-        image = self._create_icon_image()
+        image = _build_tray_icon()
         menu_items = self._build_menu_items()
         menu = Menu(*menu_items)
 
@@ -36,6 +36,27 @@ def mock_config():
     return config
 
 
+class FakeConfig:
+    """Minimal dict-backed stand-in for Config."""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.set_calls = []
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+        self.set_calls.append(key)
+
+
+@pytest.fixture
+def fake_config():
+    """Factory for dict-backed configs: fake_config({'key': value})."""
+    return FakeConfig
+
+
 @pytest.fixture
 def sample_txt_file():
     """Create sample .txt file for testing."""
@@ -244,3 +244,57 @@ class TestConfigPersistence:
                 config.save(secure=True)
 
                 assert os.path.exists(config_file)
+
+    def test_concurrent_set_keeps_valid_file(self, temp_config_dir):
+        """Test that set() from several threads never interleaves writes."""
+        import threading
+
+        config_file = os.path.join(temp_config_dir, 'config.json')
+
+        with patch.object(Config, 'CONFIG_DIR', temp_config_dir):
+            with patch.object(Config, 'CONFIG_FILE', config_file):
+                config = Config()
+
+                def writer(name):
+                    for i in range(20):
+                        config.set(f'{name}_{i}', i)
+
+                threads = [threading.Thread(target=writer, args=(n,)) for n in ('a', 'b')]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                assert data['a_19'] == 19
+                assert data['b_19'] == 19
+
+    def test_setters_share_the_save_lock(self, temp_config_dir):
+        """Test that dedicated setters and set() can run concurrently."""
+        import threading
+
+        config_file = os.path.join(temp_config_dir, 'config.json')
+
+        with patch.object(Config, 'CONFIG_DIR', temp_config_dir):
+            with patch.object(Config, 'CONFIG_FILE', config_file):
+                config = Config()
+
+                def set_hotkeys():
+                    for i in range(20):
+                        config.set_screenshot_hotkey(f'ctrl+{i}')
+
+                def set_history():
+                    for i in range(20):
+                        config.set('history', [{'id': str(i)}])
+
+                threads = [threading.Thread(target=set_hotkeys), threading.Thread(target=set_history)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                assert data['screenshot_hotkey'] == 'ctrl+19'
+                assert data['history'] == [{'id': '19'}]
@@ -0,0 +1,32 @@
+"""
+Unit tests for drop_handler.py - tkinterdnd2 drop data parsing.
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.drop_handler import parse_tkdnd_paths
+
+
+class TestParseTkdndPaths:
+    """Tests for splitting tkinterdnd2 drop strings into paths."""
+
+    @pytest.mark.parametrize("data,expected", [
+        (r"C:\docs\a.txt", [r"C:\docs\a.txt"]),
+        (r"C:\docs\a.txt C:\docs\b.pdf", [r"C:\docs\a.txt", r"C:\docs\b.pdf"]),
+        (r"{C:\My Docs\a b.txt}", [r"C:\My Docs\a b.txt"]),
+        (r"{C:\My Docs\a.txt} C:\docs\b.pdf {C:\x y\c.png}",
+         [r"C:\My Docs\a.txt", r"C:\docs\b.pdf", r"C:\x y\c.png"]),
+        (r"C:\docs\a.txt   {C:\My Docs\b.txt}", [r"C:\docs\a.txt", r"C:\My Docs\b.txt"]),
+        ("/home/user/photo.png", ["/home/user/photo.png"]),
+    ])
+    def test_parses_paths(self, data, expected):
+        """Test plain, braced and mixed path lists."""
+        assert parse_tkdnd_paths(data) == expected
+
+    @pytest.mark.parametrize("data", ["", "   ", "{}", "{} {}"])
+    def test_empty_input(self, data):
+        """Test that blank data and empty braces give no paths."""
+        assert parse_tkdnd_paths(data) == []
@@ -0,0 +1,148 @@
+"""
+Unit tests for history.py - Translation history and language detection.
+"""
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.history import HistoryManager
+
+
+@pytest.fixture
+def history_manager():
+    """HistoryManager backed by a mock config."""
+    return HistoryManager(MagicMock())
+
+
+class TestLanguageDetection:
+    """Tests for HistoryManager._detect_language."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Hello world", "English"),
+        ("Xin chào thế giới", "Vietnamese"),
+        ("ĐIỆN THOẠI", "Vietnamese"),
+        ("Привет мир", "Russian"),
+        ("안녕하세요", "Korean"),
+        ("你好世界", "Chinese"),
+        ("こんにちは世界", "Japanese"),
+        ("カタカナ", "Japanese"),
+    ])
+    def test_detects_script(self, history_manager, text, expected):
+        """Test detection of each supported script."""
+        assert history_manager._detect_language(text) == expected
+
+    def test_empty_text_is_unknown(self, history_manager):
+        """Test that empty input returns Unknown."""
+        assert history_manager._detect_language("") == "Unknown"
+
+    def test_no_letters_is_unknown(self, history_manager):
+        """Test that digits and punctuation only return Unknown."""
+        assert history_manager._detect_language("123 ... !!!") == "Unknown"
+
+    def test_kana_wins_over_kanji(self, history_manager):
+        """Test that any kana marks mostly-kanji text as Japanese."""
+        assert history_manager._detect_language("日本語の文章") == "Japanese"
+
+
+class TestHistoryEntries:
+    """Tests for adding, listing and deleting history entries."""
+
+    def test_add_entry_newest_first(self, fake_config):
+        """Test that new entries are stored at the front."""
+        config = fake_config()
+        manager = HistoryManager(config)
+
+        manager.add_entry("first text", "a", "English")
+        manager.add_entry("second text", "b", "English")
+        manager.flush()
+
+        history = manager.get_history()
+        assert [h['original'] for h in history] == ["second text", "first text"]
+        assert config.values['history'] == history
+
+    def test_add_entry_enforces_limit(self, fake_config):
+        """Test that history is capped at MAX_HISTORY entries."""
+        config = fake_config()
+        manager = HistoryManager(config)
+
+        for i in range(HistoryManager.MAX_HISTORY + 5):
+            manager.add_entry(f"text {i}", "t", "English")
+        manager.flush()
+
+        history = manager.get_history()
+        assert len(history) == HistoryManager.MAX_HISTORY
+        assert history[0]['original'] == f"text {HistoryManager.MAX_HISTORY + 4}"
+        assert len(config.values['history']) == HistoryManager.MAX_HISTORY
+
+    def test_add_entry_skips_trivial_text(self, fake_config):
+        """Test that empty or one-character text is not saved."""
+        config = fake_config()
+        manager = HistoryManager(config)
+
+        manager.add_entry(" a ", "b", "English")
+
+        assert manager.get_history() == []
+        assert config.set_calls == []
+
+    def test_loads_existing_history(self, fake_config):
+        """Test that history saved in config is picked up."""
+        config = fake_config({'history': [{'id': 'x', 'original': 'old'}]})
+        manager = HistoryManager(config)
+
+        assert manager.get_history() == [{'id': 'x', 'original': 'old'}]
+
+    def test_delete_and_clear(self, fake_config):
+        """Test deleting one entry and clearing all entries."""
+        config = fake_config({'history': [{'id': 'a'}, {'id': 'b'}]})
+        manager = HistoryManager(config)
+
+        manager.delete_entry('a')
+        manager.flush()
+        assert manager.get_history() == [{'id': 'b'}]
+        assert config.values['history'] == [{'id': 'b'}]
+
+        manager.clear_history()
+        manager.flush()
+        assert manager.get_history() == []
+        assert config.values['history'] == []
+
+    def test_rapid_changes_are_coalesced(self, fake_config):
+        """Test that a burst of entries is saved in a single write."""
+        config = fake_config()
+        manager = HistoryManager(config)
+
+        for i in range(10):
+            manager.add_entry(f"text {i}", "t", "English")
+        manager.close()
+
+        assert len(config.set_calls) == 1
+        assert len(config.values['history']) == 10
+
+    def test_concurrent_entries_start_one_writer(self, fake_config):
+        """Test that entries added from several threads share one writer thread."""
+        import threading
+
+        config = fake_config()
+        manager = HistoryManager(config)
+        start = threading.Barrier(8)
+        before = set(threading.enumerate())
+
+        def add(i):
+            start.wait()
+            manager.add_entry(f"text {i}", "t", "English")
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        writers = [t for t in threading.enumerate()
+                   if t.name == "history-writer" and t not in before]
+        assert writers == [manager._persist_thread]
+        manager.close()
+        assert not manager._persist_thread.is_alive()
+        assert len(config.values['history']) == 8
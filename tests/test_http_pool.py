@@ -0,0 +1,169 @@
+"""
+Unit tests for http_pool.py - Keep-alive HTTPS connection pool.
+
+Requests go to a local plain-HTTP server; _connect is patched to open
+HTTPConnection so no TLS is involved.
+"""
+import http.client
+import os
+import sys
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import http_pool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves a few fixed paths and records what it received."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        server = self.server
+        server.hits.append((self.command, self.path))
+        server.clients.add(self.client_address)
+
+        if self.path == '/drop':
+            # First request is processed, then the connection closes without a reply
+            server.drops += 1
+            if server.drops == 1:
+                self.close_connection = True
+                return
+        if self.path == '/redirect':
+            self._reply(302, b'', {'Location': '/ok'})
+        elif self.path == '/missing':
+            self._reply(404, b'not found')
+        elif self.path == '/big':
+            self._reply(200, b'x' * 100)
+        else:
+            self._reply(200, b'ok')
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Local HTTP server; http_pool talks plain HTTP to it with an empty pool."""
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    srv.daemon_threads = True
+    srv.hits = []
+    srv.clients = set()
+    srv.drops = 0
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(http_pool, '_idle', {})
+    monkeypatch.setattr(
+        http_pool, '_connect',
+        lambda key, url, timeout: http.client.HTTPConnection(key[0], key[1], timeout=timeout)
+    )
+    srv.url = f"https://127.0.0.1:{srv.server_port}"
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+class TestRequests:
+    """Tests for basic requests and connection reuse."""
+
+    def test_reuses_connection(self, server):
+        """Test that sequential requests share one kept-alive connection."""
+        for _ in range(3):
+            assert http_pool.request('GET', f"{server.url}/ok") == (200, b'ok')
+
+        assert len(server.hits) == 3
+        assert len(server.clients) == 1
+
+    def test_follows_get_redirect(self, server):
+        """Test that a GET follows a redirect to its target."""
+        assert http_pool.request('GET', f"{server.url}/redirect") == (200, b'ok')
+        assert server.hits == [('GET', '/redirect'), ('GET', '/ok')]
+
+    def test_post_redirect_raises(self, server):
+        """Test that a POST redirect is not followed."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            http_pool.request('POST', f"{server.url}/redirect", body=b'{}')
+
+        assert exc_info.value.code == 302
+        assert server.hits == [('POST', '/redirect')]
+
+    def test_error_status_raises_http_error(self, server):
+        """Test that a 4xx response raises HTTPError with the body."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            http_pool.request('GET', f"{server.url}/missing")
+
+        assert exc_info.value.code == 404
+        assert exc_info.value.read() == b'not found'
+
+    def test_max_bytes(self, server):
+        """Test that bodies larger than max_bytes are rejected."""
+        with pytest.raises(urllib.error.URLError):
+            http_pool.request('GET', f"{server.url}/big", max_bytes=10)
+
+        status, data = http_pool.request('GET', f"{server.url}/big", max_bytes=100)
+        assert status == 200
+        assert len(data) == 100
+
+    def test_rejects_plain_http(self, server):
+        """Test that non-https URLs are refused."""
+        with pytest.raises(urllib.error.URLError):
+            http_pool.request('GET', f"http://127.0.0.1:{server.server_port}/ok")
+        assert server.hits == []
+
+
+class TestStaleConnections:
+    """Tests for resending requests when a kept-alive connection drops."""
+
+    def test_post_resent_when_send_fails(self, server, monkeypatch):
+        """Test that a POST is sent again if it never reached the server."""
+
+        class _StaleConnection:
+            sock = None
+            timeout = None
+
+            def request(self, *args, **kwargs):
+                raise BrokenPipeError()
+
+            def close(self):
+                pass
+
+        key = ('127.0.0.1', server.server_port)
+        http_pool._idle[key] = [_StaleConnection()]
+        monkeypatch.setattr(http_pool, '_is_dropped', lambda conn: False)
+
+        assert http_pool.request('POST', f"{server.url}/ok", body=b'{}') == (200, b'ok')
+        assert server.hits == [('POST', '/ok')]
+
+    def test_post_not_resent_after_drop(self, server):
+        """Test that a POST is not resent once the server may have processed it."""
+        http_pool.request('GET', f"{server.url}/ok")
+
+        with pytest.raises(urllib.error.URLError):
+            http_pool.request('POST', f"{server.url}/drop", body=b'{}')
+
+        assert server.hits.count(('POST', '/drop')) == 1
+
+    def test_get_resent_after_drop(self, server):
+        """Test that a GET is resent on a fresh connection after a drop."""
+        http_pool.request('GET', f"{server.url}/ok")
+
+        assert http_pool.request('GET', f"{server.url}/drop") == (200, b'ok')
+        assert server.hits.count(('GET', '/drop')) == 2
@@ -0,0 +1,113 @@
+"""
+Unit tests for quota_manager.py - Trial mode daily quota.
+"""
+import os
+import sys
+from datetime import date
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.quota_manager import QuotaManager
+
+
+class TestQuotaUsage:
+    """Tests for using and reading the daily quota."""
+
+    def test_reading_quota_does_not_write(self, fake_config):
+        """Test that quota info on a fresh config is not persisted."""
+        config = fake_config({'device_id': 'test-device'})
+        manager = QuotaManager(config)
+
+        info = manager.get_quota_info()
+
+        assert info['remaining'] == QuotaManager.DAILY_LIMIT
+        assert not info['is_exhausted']
+        assert 'trial_quota' not in config.set_calls
+
+    def test_use_quota_writes_once(self, fake_config):
+        """Test that one use_quota call saves the quota once."""
+        config = fake_config({'device_id': 'test-device'})
+        manager = QuotaManager(config)
+
+        assert manager.use_quota() is True
+
+        assert config.set_calls.count('trial_quota') == 1
+        assert config.values['trial_quota']['used_today'] == 1
+        assert manager.get_remaining_quota() == QuotaManager.DAILY_LIMIT - 1
+
+    def test_use_quota_exhausted(self, fake_config):
+        """Test that use_quota fails once the daily limit is reached."""
+        today = date.today().isoformat()
+        config = fake_config({'trial_quota': {
+            'used_today': QuotaManager.DAILY_LIMIT,
+            'reset_date': today,
+            'first_use_date': today,
+        }})
+        manager = QuotaManager(config)
+
+        assert manager.use_quota() is False
+        assert manager.get_quota_info()['is_exhausted']
+        assert config.set_calls == []
+
+    def test_new_day_resets_quota(self, fake_config):
+        """Test that yesterday's usage is reset and first use date kept."""
+        config = fake_config({'trial_quota': {
+            'used_today': QuotaManager.DAILY_LIMIT,
+            'reset_date': '2000-01-01',
+            'first_use_date': '1999-12-31',
+        }})
+        manager = QuotaManager(config)
+
+        assert manager.get_remaining_quota() == QuotaManager.DAILY_LIMIT
+        assert manager.use_quota() is True
+
+        quota = config.values['trial_quota']
+        assert quota['used_today'] == 1
+        assert quota['reset_date'] == date.today().isoformat()
+        assert quota['first_use_date'] == '1999-12-31'
+
+
+class TestDeviceId:
+    """Tests for device ID creation and caching."""
+
+    def test_reading_quota_without_device_id_does_not_write(self, fake_config):
+        """Test that quota info on an empty config creates no device ID."""
+        config = fake_config()
+        manager = QuotaManager(config)
+
+        assert manager.get_remaining_quota() == QuotaManager.DAILY_LIMIT
+        assert config.set_calls == []
+
+    def test_first_use_creates_and_stores_device_id(self, fake_config):
+        """Test that the first use stores a new device ID with the quota."""
+        config = fake_config()
+        manager = QuotaManager(config)
+
+        assert manager.use_quota() is True
+
+        device_id = config.values['device_id']
+        assert device_id
+        assert config.values['trial_quota']['device_id'] == device_id
+        assert manager.device_id == device_id
+
+    def test_device_id_is_per_config(self, fake_config):
+        """Test that a device ID is not shared between managers and configs."""
+        first = QuotaManager(fake_config({'device_id': 'device-a'}))
+        second = QuotaManager(fake_config({'device_id': 'device-b'}))
+
+        assert first.device_id == 'device-a'
+        assert second.device_id == 'device-b'
+
+    def test_device_id_shared_for_same_config(self, fake_config):
+        """Test that managers on one config generate the device ID only once."""
+        config = fake_config()
+        first = QuotaManager(config)
+        second = QuotaManager(config)
+
+        with patch.object(QuotaManager, '_generate_device_id', return_value='generated') as generate:
+            assert first.device_id == 'generated'
+            config.values.pop('device_id')
+            assert second.device_id == 'generated'
+
+        generate.assert_called_once()